@@ -10,8 +10,10 @@ You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2
 
 from __future__ import annotations
 
+from pydantic import Field
+
 from engine.events.models import DeploymentEvent
 
 
 class DeploymentEventRequest(DeploymentEvent):
-    tenant_id: str
+    tenant_id: str = Field(pattern=r"\S")
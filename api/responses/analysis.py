@@ -24,7 +24,7 @@ from engine.forecast.trajectory import TrajectoryForecast
 from engine.ml.clustering import AnomalyCluster
 from engine.ml.ranking import RankedCause
 
-from .base import NpModel
+from .base import NpModel, NumpyCoerced
 from .anomalies import MetricAnomaly
 from .logs import LogBurst, LogPattern
 from .traces import ErrorPropagation, ServiceLatency
@@ -49,17 +49,17 @@ class AnalysisReport(NpModel):
     log_patterns: List[LogPattern]
     service_latency: List[ServiceLatency]
     error_propagation: List[ErrorPropagation]
-    slo_alerts: List[SloBurnAlert] = []
+    slo_alerts: NumpyCoerced[List[SloBurnAlert]] = Field(default_factory=list)
     root_causes: List[RootCause]
-    ranked_causes: List[RankedCause] = []
-    change_points: List[ChangePoint] = []
-    log_metric_links: List[LogMetricLink] = []
-    forecasts: List[TrajectoryForecast] = []
-    degradation_signals: List[DegradationSignal] = []
-    anomaly_clusters: List[AnomalyCluster] = []
-    granger_results: List[GrangerResult] = []
-    bayesian_scores: List[BayesianScore] = []
-    analysis_warnings: List[str] = []
+    ranked_causes: NumpyCoerced[List[RankedCause]] = Field(default_factory=list)
+    change_points: NumpyCoerced[List[ChangePoint]] = Field(default_factory=list)
+    log_metric_links: NumpyCoerced[List[LogMetricLink]] = Field(default_factory=list)
+    forecasts: NumpyCoerced[List[TrajectoryForecast]] = Field(default_factory=list)
+    degradation_signals: NumpyCoerced[List[DegradationSignal]] = Field(default_factory=list)
+    anomaly_clusters: NumpyCoerced[List[AnomalyCluster]] = Field(default_factory=list)
+    granger_results: NumpyCoerced[List[GrangerResult]] = Field(default_factory=list)
+    bayesian_scores: NumpyCoerced[List[BayesianScore]] = Field(default_factory=list)
+    analysis_warnings: List[str] = Field(default_factory=list)
     overall_severity: Severity
     summary: str
     quality: Optional[AnalysisQuality] = None
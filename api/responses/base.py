@@ -10,29 +10,118 @@ You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2
 
 from __future__ import annotations
 
-from typing import TypeAlias
+from typing import Annotated, Callable, Dict, Final, List, TypeAlias, TypeVar, cast
 
-import numpy as np
-from pydantic import BaseModel, SerializerFunctionWrapHandler, model_serializer
+from numpy import float32, float64, int32, int64
+from numpy import floating as _np_floating
+from numpy import integer as _np_integer
+from numpy import ndarray as _np_ndarray
+from pydantic import BaseModel, SerializationInfo, SerializerFunctionWrapHandler, WrapSerializer
 
 SerializableValue: TypeAlias = object
+_T = TypeVar("_T")
+_Converter: TypeAlias = Callable[..., SerializableValue]
+
+
+# Dispatch values: None leaves the value as is, _WALK descends into a container,
+# anything else is a converter. _UNRESOLVED marks a type not yet looked up.
+_WALK: Final = object()
+_UNRESOLVED: Final = object()
+
+_DISPATCH: Dict[type, object] = {
+    dict: _WALK,
+    list: _WALK,
+    str: None,
+    int: None,
+    float: None,
+    bool: None,
+    type(None): None,
+    int64: int,
+    int32: int,
+    float64: float,
+    float32: float,
+    _np_ndarray: _np_ndarray.tolist,
+}
+
+
+def _resolve(value_type: type) -> object:
+    converter: object = None
+    if issubclass(value_type, (dict, list)):
+        converter = _WALK
+    elif issubclass(value_type, _np_integer):
+        converter = int
+    elif issubclass(value_type, _np_floating):
+        converter = float
+    elif issubclass(value_type, _np_ndarray):
+        converter = _np_ndarray.tolist
+    _DISPATCH[value_type] = converter
+    return converter
+
+
+def _as_builtin(value: SerializableValue) -> SerializableValue:
+    if type(value) is dict or type(value) is list:
+        return value
+    return dict(value) if isinstance(value, dict) else list(value) if isinstance(value, list) else value
 
 
 def _coerce(obj: SerializableValue) -> SerializableValue:
-    if isinstance(obj, dict):
-        return {k: _coerce(v) for k, v in obj.items()}
-    if isinstance(obj, list):
-        return [_coerce(v) for v in obj]
-    if isinstance(obj, np.integer):
-        return int(obj)
-    if isinstance(obj, np.floating):
-        return float(obj)
-    if isinstance(obj, np.ndarray):
-        return obj.tolist()
+    lookup = _DISPATCH.get
+    unresolved = _UNRESOLVED
+    resolve = _resolve
+    walk = _WALK
+    as_builtin = _as_builtin
+    dict_type = dict
+    converter = lookup(type(obj), unresolved)
+    if converter is unresolved:
+        converter = resolve(type(obj))
+    if converter is None:
+        return obj
+    if converter is not walk:
+        return cast(_Converter, converter)(obj)
+    obj = as_builtin(obj)
+    stack: List[SerializableValue] = [obj]
+    pop = stack.pop
+    push = stack.append
+    while stack:
+        node = pop()
+        if isinstance(node, dict_type):
+            for key, value in node.items():
+                converter = lookup(type(value), unresolved)
+                if converter is None:
+                    continue
+                if converter is unresolved:
+                    converter = resolve(type(value))
+                if converter is walk:
+                    value = node[key] = as_builtin(value)
+                    push(value)
+                elif converter is not None:
+                    node[key] = cast(_Converter, converter)(value)
+        elif isinstance(node, list):
+            for index, value in enumerate(node):
+                converter = lookup(type(value), unresolved)
+                if converter is None:
+                    continue
+                if converter is unresolved:
+                    converter = resolve(type(value))
+                if converter is walk:
+                    value = node[index] = as_builtin(value)
+                    push(value)
+                elif converter is not None:
+                    node[index] = cast(_Converter, converter)(value)
     return obj
 
 
+def _serialize_numpy(
+    value: SerializableValue,
+    handler: SerializerFunctionWrapHandler,
+    info: SerializationInfo,
+) -> SerializableValue:
+    serialized = handler(value)
+    return serialized if info.mode_is_json() else _coerce(serialized)
+
+
+NumpyCoerced: TypeAlias = Annotated[_T, WrapSerializer(_serialize_numpy)]
+
+
 class NpModel(BaseModel):
-    @model_serializer(mode="wrap")
-    def _serialize(self, handler: SerializerFunctionWrapHandler) -> SerializableValue:
-        return _coerce(handler(self))
+    pass
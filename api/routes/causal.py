@@ -15,13 +15,10 @@ from typing import Dict
 from fastapi import APIRouter, Depends, Query
 
 from api.requests import AnalyzeRequest, CorrelateRequest
-from api.routes.common import coerce_query_value, get_provider, safe_call
-from api.routes.exception import handle_exceptions
-from config import DEFAULT_METRIC_QUERIES, DEFAULT_SERVICE_NAME
-from datasources.provider import DataSourceProvider
+from api.routes.common import OrjsonResponse, coerce_query_value, fetch_requested_metrics, get_provider
+from config import DEFAULT_SERVICE_NAME
 from engine import anomaly
 from engine.causal import CausalGraph, bayesian_score, test_all_pairs
-from engine.fetcher import fetch_metrics
 from engine.registry import get_registry
 from custom_types.json import JSONDict
 from services.security_service import enforce_request_tenant, require_permission_dependency
@@ -32,19 +29,29 @@ router = APIRouter(tags=["Causal"])
 
 def _select_top_variance_series(series_map: Dict[str, list[float]], max_series: int) -> Dict[str, list[float]]:
 
-    ranked: list[tuple[str, float]] = []
-    for name, values in series_map.items():
-        arr = np.array(values, dtype=float)
-        finite = arr[np.isfinite(arr)]
-        if finite.size < 12:
-            continue
-        variance = float(np.var(finite))
-        if variance <= 0:
-            continue
-        ranked.append((name, variance))
-    ranked.sort(key=lambda item: item[1], reverse=True)
-    selected = {name for name, _ in ranked[:max_series]}
-    return {name: values for name, values in series_map.items() if name in selected}
+    names = list(series_map)
+    if not names or max_series <= 0:
+        return {}
+    width = max(len(values) for values in series_map.values())
+    matrix = np.full((len(names), width), np.nan, dtype=float)
+    for row, values in enumerate(series_map.values()):
+        matrix[row, : len(values)] = values
+    finite = np.isfinite(matrix)
+    counts = finite.sum(axis=1)
+    matrix = np.where(finite, matrix, 0.0)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        means = matrix.sum(axis=1) / counts
+        deviations = np.where(finite, matrix - means[:, None], 0.0)
+        variances = (deviations * deviations).sum(axis=1) / counts
+
+    candidates = np.flatnonzero((counts >= 12) & (variances > 0))
+    if candidates.size > max_series:
+        candidate_var = variances[candidates]
+        cutoff = candidate_var[np.argpartition(candidate_var, -max_series)[-max_series]]
+        above = candidates[candidate_var > cutoff]
+        ties = candidates[candidate_var == cutoff][: max_series - above.size]
+        candidates = np.sort(np.concatenate((above, ties)))
+    return {names[idx]: series_map[names[idx]] for idx in candidates.tolist()}
 
 
 def _common_causes_for_roots(causal_graph: CausalGraph, roots: list[str]) -> Dict[str, list[str]]:
@@ -56,40 +63,42 @@ def _common_causes_for_roots(causal_graph: CausalGraph, roots: list[str]) -> Dic
     return common
 
 
-async def _fetch_requested_metrics(provider: DataSourceProvider, req: CorrelateRequest) -> list[tuple[str, JSONDict]]:
-    queries = list(dict.fromkeys((getattr(req, "metric_queries", None) or []) + DEFAULT_METRIC_QUERIES))
-    return await safe_call(fetch_metrics(provider, queries, req.start, req.end, req.step))
-
-
 @router.post(
     "/causal/granger",
     summary="Granger causality between metrics (bounded by default)",
+    response_class=OrjsonResponse,
     dependencies=[Depends(require_permission_dependency("read:rca"))],
 )
-@handle_exceptions
 async def granger_causality(
     req: CorrelateRequest,
     limit: int = Query(default=100, ge=1, le=2000),
     min_strength: float = Query(default=0.05, ge=0.0, le=1.0),
     max_series: int = Query(default=25, ge=2, le=200),
     include_raw: bool = Query(default=False),
-) -> JSONDict:
+) -> OrjsonResponse:
     limit = coerce_query_value(limit, int)
     min_strength = coerce_query_value(min_strength, float)
     max_series = coerce_query_value(max_series, int)
     include_raw = coerce_query_value(include_raw, bool)
     req = enforce_request_tenant(req)
     provider = get_provider(req.tenant_id)
-    metrics_raw = await _fetch_requested_metrics(provider, req)
+    metrics_raw = await fetch_requested_metrics(provider, req)
 
-    series_map: Dict[str, list[float]] = {}
-    for query_string, resp in metrics_raw:
-        for metric_name, _, vals in anomaly.iter_series(resp, query_hint=query_string):
-            series_key = f"{query_string}::{metric_name}"
-            series_map[series_key] = vals
+    series_map: Dict[str, list[float]] = {
+        f"{query_string}::{metric_name}": vals
+        for query_string, resp in metrics_raw
+        for metric_name, _, vals in anomaly.iter_series(resp, query_hint=query_string)
+    }
 
     selected_series = _select_top_variance_series(series_map, max_series=max_series)
-    fresh_results = test_all_pairs(selected_series) if len(selected_series) >= 2 else []
+    raw_pairs = test_all_pairs(series_map) if include_raw and len(series_map) >= 2 else []
+    if include_raw:
+        fresh_results = [
+            item for item in raw_pairs
+            if item.cause_metric in selected_series and item.effect_metric in selected_series
+        ]
+    else:
+        fresh_results = test_all_pairs(selected_series) if len(selected_series) >= 2 else []
     fresh_results = [item for item in fresh_results if float(item.strength) >= float(min_strength)]
     fresh_results = sorted(fresh_results, key=lambda item: float(item.strength), reverse=True)[:limit]
 
@@ -113,25 +122,24 @@ async def granger_causality(
     causal_graph = CausalGraph()
     causal_graph.from_granger_results(fresh_results)
 
-    response: JSONDict = {
+    response: Dict[str, object] = {
         "fresh_pairs": len(fresh_results),
         "warm_model_pairs": len(merged),
         "candidate_series": len(series_map),
         "selected_series": len(selected_series),
-        "causal_pairs": [r.__dict__ for r in fresh_results],
+        "causal_pairs": fresh_results,
         "warm_causal_pairs": warm_causal_pairs,
         "root_causes": causal_graph.root_causes(),
         "interventions": {
-            root: causal_graph.simulate_intervention(root).__dict__
+            root: causal_graph.simulate_intervention(root)
             for root in causal_graph.root_causes()
         },
         "topological_order": causal_graph.topological_sort(),
         "common_causes_between_roots": _common_causes_for_roots(causal_graph, causal_graph.root_causes()),
     }
     if include_raw:
-        raw_pairs = test_all_pairs(series_map) if len(series_map) >= 2 else []
-        response["raw_causal_pairs"] = [r.__dict__ for r in raw_pairs]
-    return response
+        response["raw_causal_pairs"] = raw_pairs
+    return OrjsonResponse(response)
 
 
 @router.post(
@@ -139,7 +147,6 @@ async def granger_causality(
     summary="Bayesian posterior over RCA categories given observed signals",
     dependencies=[Depends(require_permission_dependency("read:rca"))],
 )
-@handle_exceptions
 async def bayesian_rca(req: AnalyzeRequest) -> JSONDict:
     req = enforce_request_tenant(req)
     deployment_events = await get_registry().events_in_window(req.tenant_id, req.start, req.end)
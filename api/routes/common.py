@@ -15,10 +15,16 @@ You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2
 
 from __future__ import annotations
 
-from collections.abc import Callable
+import asyncio
+import logging
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from functools import lru_cache
 from typing import Awaitable, Protocol, TypeVar
 
+import orjson
 from fastapi import HTTPException
+from fastapi.responses import JSONResponse
 
 from config import DEFAULT_METRIC_QUERIES
 from datasources.data_config import DataSourceSettings
@@ -28,9 +34,19 @@ from engine.fetcher import fetch_metrics
 from services.security_service import get_context_tenant
 
 
+log = logging.getLogger(__name__)
+
 _T = TypeVar("_T")
 _QueryValueT = TypeVar("_QueryValueT")
 _providers: dict[str, DataSourceProvider] = {}
+_query_slots: dict[str, asyncio.Semaphore] = {}
+
+
+class OrjsonResponse(JSONResponse):
+    """JSON response rendered by orjson, which encodes dataclasses and numpy values natively."""
+
+    def render(self, content: object) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_SERIALIZE_NUMPY)
 
 
 class _SupportsDefault(Protocol[_QueryValueT]):
@@ -44,30 +60,66 @@ class _MetricRequestLike(Protocol):
     step: str
 
 
+@lru_cache(maxsize=1)
+def datasource_settings() -> DataSourceSettings:
+    return DataSourceSettings()
+
+
 def get_provider(tenant_id: str) -> DataSourceProvider:
     resolved_tenant_id = get_context_tenant(tenant_id)
     provider = _providers.get(resolved_tenant_id)
     if provider is None:
-        provider = DataSourceProvider(tenant_id=resolved_tenant_id, settings=DataSourceSettings())
+        provider = DataSourceProvider(tenant_id=resolved_tenant_id, settings=datasource_settings())
         _providers[resolved_tenant_id] = provider
     return provider
 
 
+def tenant_query_slots(tenant_id: str) -> asyncio.Semaphore:
+    resolved_tenant_id = get_context_tenant(tenant_id)
+    slots = _query_slots.get(resolved_tenant_id)
+    if slots is None:
+        slots = asyncio.Semaphore(max(1, int(datasource_settings().max_concurrent_queries)))
+        _query_slots[resolved_tenant_id] = slots
+    return slots
+
+
+async def bounded(slots: asyncio.Semaphore, coro: Awaitable[_T]) -> _T:
+    async with slots:
+        return await coro
+
+
 async def close_providers() -> None:
 
     providers = list(_providers.values())
     _providers.clear()
-    for provider in providers:
-        await provider.aclose()
+    _query_slots.clear()
+    results = await asyncio.gather(*(provider.aclose() for provider in providers), return_exceptions=True)
+    for provider, result in zip(providers, results):
+        if isinstance(result, Exception):
+            log.warning("Closing provider for tenant %s failed: %s", provider.tenant_id, result)
 
 
-async def safe_call(coro: Awaitable[_T], status_code: int = 502) -> _T:
+@contextmanager
+def upstream_errors(status_code: int = 502) -> Iterator[None]:
     try:
-        return await coro
+        yield
     except Exception as exc:
         raise HTTPException(status_code=status_code, detail=str(exc)) from exc
 
 
+async def safe_call(coro: Awaitable[_T], status_code: int = 502) -> _T:
+    with upstream_errors(status_code):
+        return await coro
+
+
+async def result_or_none(coro: Awaitable[_T]) -> _T | None:
+    try:
+        return await coro
+    except Exception:
+        log.warning("partial result: upstream call failed", exc_info=True)
+        return None
+
+
 def to_nanoseconds(ts: int) -> int:
 
     return ts * 1_000_000_000
@@ -81,9 +133,19 @@ def coerce_query_value(
     return cast(raw)
 
 
+@lru_cache(maxsize=256)
+def _merged_metric_queries(requested: tuple[str, ...], defaults: tuple[str, ...]) -> tuple[str, ...]:
+    return tuple(dict.fromkeys(requested + defaults))
+
+
+def merge_metric_queries(requested: list[str] | None, defaults: list[str]) -> list[str]:
+    return list(_merged_metric_queries(tuple(requested or ()), tuple(defaults)))
+
+
 async def fetch_requested_metrics(
     provider: DataSourceProvider,
     req: _MetricRequestLike,
 ) -> list[tuple[str, JSONDict]]:
-    queries = list(dict.fromkeys((getattr(req, "metric_queries", None) or []) + DEFAULT_METRIC_QUERIES))
-    return await safe_call(fetch_metrics(provider, queries, req.start, req.end, req.step))
+    queries = merge_metric_queries(getattr(req, "metric_queries", None), DEFAULT_METRIC_QUERIES)
+    with upstream_errors():
+        return await fetch_metrics(provider, queries, req.start, req.end, req.step)
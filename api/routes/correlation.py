@@ -14,8 +14,15 @@ import asyncio
 from fastapi import APIRouter, Depends
 
 from api.requests import CorrelateRequest
-from api.routes.common import get_provider
-from api.routes.exception import handle_exceptions
+from api.routes.common import (
+    OrjsonResponse,
+    bounded,
+    get_provider,
+    merge_metric_queries,
+    result_or_none,
+    tenant_query_slots,
+    to_nanoseconds,
+)
 from config import DEFAULT_METRIC_QUERIES
 from engine import anomaly, logs
 from engine.correlation import correlate, link_logs_to_metrics
@@ -23,7 +30,6 @@ from engine.fetcher import fetch_metrics
 from engine.log_query import build_log_query
 from engine.registry import get_registry
 from services.security_service import enforce_request_tenant, require_permission_dependency
-from custom_types.json import JSONDict
 
 router = APIRouter(tags=["Correlation"])
 
@@ -31,33 +37,34 @@ router = APIRouter(tags=["Correlation"])
 @router.post(
     "/correlate",
     summary="Cross-signal temporal correlation without full RCA",
+    response_class=OrjsonResponse,
     dependencies=[Depends(require_permission_dependency("read:rca"))],
 )
-@handle_exceptions
-async def correlate_signals(req: CorrelateRequest) -> JSONDict:
+async def correlate_signals(req: CorrelateRequest) -> OrjsonResponse:
     req = enforce_request_tenant(req)
     log_query = build_log_query(req.services, req.log_query)
     provider = get_provider(req.tenant_id)
-    all_queries = list(dict.fromkeys((req.metric_queries or []) + DEFAULT_METRIC_QUERIES))
+    slots = tenant_query_slots(req.tenant_id)
+    all_queries = merge_metric_queries(req.metric_queries, DEFAULT_METRIC_QUERIES)
+    start_ns = to_nanoseconds(req.start)
+    end_ns = to_nanoseconds(req.end)
 
-    logs_raw, metrics_raw = await asyncio.gather(
-        provider.query_logs(
+    async with asyncio.TaskGroup() as tg:
+        logs_task = tg.create_task(result_or_none(bounded(slots, provider.query_logs(
             query=log_query,
-            start=req.start * 1_000_000_000,
-            end=req.end * 1_000_000_000,
-        ),
-        fetch_metrics(provider, all_queries, req.start, req.end, req.step),
-        return_exceptions=True,
-    )
+            start=start_ns,
+            end=end_ns,
+        ))))
+        metrics_task = tg.create_task(result_or_none(
+            fetch_metrics(provider, all_queries, req.start, req.end, req.step, limiter=slots)
+        ))
+    logs_raw = logs_task.result()
+    metrics_raw = metrics_task.result()
 
-    metric_anomalies = []
-    if isinstance(metrics_raw, list):
-        for query_string, resp in metrics_raw:
-            for metric_name, ts, vals in anomaly.iter_series(resp, query_hint=query_string):
-                metric_anomalies.extend(anomaly.detect(metric_name, ts, vals))
+    metric_anomalies = anomaly.detect_batch(metrics_raw) if metrics_raw is not None else []
 
     log_bursts_list = []
-    if isinstance(logs_raw, dict):
+    if logs_raw is not None:
         log_bursts_list = logs.detect_bursts(logs_raw)
 
     # compute confidence using tenant-specific signal weights if available
@@ -71,7 +78,7 @@ async def correlate_signals(req: CorrelateRequest) -> JSONDict:
     )
     links = link_logs_to_metrics(metric_anomalies, log_bursts_list)
 
-    return {
+    return OrjsonResponse({
         "correlated_events": [
             {
                 "window_start": e.window_start,
@@ -92,4 +99,4 @@ async def correlate_signals(req: CorrelateRequest) -> JSONDict:
             }
             for lk in links
         ],
-    }
+    })
@@ -9,12 +9,11 @@ You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2
 
 from __future__ import annotations
 
-from typing import Dict, List
+from typing import Annotated, Dict, List
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, Query
 
 from engine.events.models import DeploymentEvent
-from api.routes.exception import handle_exceptions
 from services.security_service import enforce_request_tenant, get_context_tenant, require_permission_dependency
 from engine.registry import get_registry
 from api.requests import DeploymentEventRequest
@@ -28,12 +27,12 @@ router = APIRouter(tags=["Events"])
     summary="Register a deployment event for RCA correlation",
     dependencies=[Depends(require_permission_dependency("create:rca"))],
 )
-@handle_exceptions
-async def register_deployment(req: DeploymentEventRequest, tenant_id: str | None = None) -> Dict[str, str]:
+async def register_deployment(
+    req: DeploymentEventRequest,
+    tenant_id: Annotated[str | None, Query(pattern=r"\S")] = None,
+) -> Dict[str, str]:
     req = enforce_request_tenant(req)
     tid = get_context_tenant(tenant_id or req.tenant_id)
-    if not isinstance(tid, str) or not tid.strip():
-        raise HTTPException(status_code=400, detail="tenant_id must be a non-empty string")
 
     await get_registry().register_event(
         tid,
@@ -47,7 +46,6 @@ async def register_deployment(req: DeploymentEventRequest, tenant_id: str | None
     summary="List registered deployment events for a tenant",
     dependencies=[Depends(require_permission_dependency("read:rca"))],
 )
-@handle_exceptions
 async def list_deployments(tenant_id: str) -> List[JSONDict]:
     return [
         {
@@ -68,7 +66,6 @@ async def list_deployments(tenant_id: str) -> List[JSONDict]:
     summary="Clear all deployment events for a tenant",
     dependencies=[Depends(require_permission_dependency("delete:rca"))],
 )
-@handle_exceptions
 async def clear_deployments(tenant_id: str) -> Dict[str, str]:
     resolved_tenant = get_context_tenant(tenant_id)
     await get_registry().clear_events(resolved_tenant)
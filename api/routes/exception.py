@@ -1,12 +1,12 @@
 """
-Centralized exception handling decorator for API route functions.
+Centralized exception handling for API routes.
 
-The :func:`handle_exceptions` decorator wraps an endpoint handler, catching any
-uncaught exceptions and converting them into :class:`fastapi.HTTPException`
-responses.  HTTPExceptions raised by the handler are propagated untouched, thus
-preserving status codes and detail messages defined locally.  All other
-exceptions are turned into a ``500`` error with the exception message as the
-response detail.
+:func:`unhandled_exception_handler` is registered on the application for the
+base :class:`Exception` type, so any uncaught exception is logged server-side
+and turned into a generic ``500`` JSON error.  The exception message is never
+returned to clients, since it may carry backend or database driver details.
+:class:`fastapi.HTTPException` keeps FastAPI's own handler, thus preserving
+status codes and detail messages defined locally.
 
 
 Copyright (c) 2026 Stefan Kumarasinghe
@@ -18,39 +18,14 @@ You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2
 
 from __future__ import annotations
 
-import inspect
-from functools import wraps
-from typing import Awaitable, Callable, TypeVar, cast
-from fastapi import HTTPException
+import logging
 
-F = TypeVar("F", bound=Callable[..., object])
+from fastapi import Request
+from fastapi.responses import JSONResponse
 
+log = logging.getLogger(__name__)
 
-def handle_exceptions(func: F) -> F:
 
-    if inspect.iscoroutinefunction(func):
-        async_func = cast(Callable[..., Awaitable[object]], func)
-
-        @wraps(func)
-        async def async_wrapper(*args: object, **kwargs: object) -> object:
-            try:
-                return await async_func(*args, **kwargs)
-            except HTTPException:
-                raise
-            except Exception as exc:
-                raise HTTPException(status_code=500, detail=str(exc)) from exc
-
-        return cast(F, async_wrapper)
-
-    sync_func = cast(Callable[..., object], func)
-
-    @wraps(func)
-    def sync_wrapper(*args: object, **kwargs: object) -> object:
-        try:
-            return sync_func(*args, **kwargs)
-        except HTTPException:
-            raise
-        except Exception as exc:
-            raise HTTPException(status_code=500, detail=str(exc)) from exc
-
-    return cast(F, sync_wrapper)
+async def unhandled_exception_handler(request: Request, exc: Exception) -> JSONResponse:
+    log.error("Unhandled error on %s %s", request.method, request.url.path, exc_info=exc)
+    return JSONResponse(status_code=500, content={"detail": "Internal Server Error"})
@@ -9,13 +9,13 @@ You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2
 
 from __future__ import annotations
 
+import heapq
 from typing import List
 
 from fastapi import APIRouter, Depends, Query
 
 from api.requests import CorrelateRequest
-from api.routes.common import coerce_query_value, fetch_requested_metrics, get_provider
-from api.routes.exception import handle_exceptions
+from api.routes.common import OrjsonResponse, coerce_query_value, fetch_requested_metrics, get_provider
 from engine import anomaly
 from config import FORECAST_THRESHOLDS
 from engine.forecast import analyze_degradation, forecast
@@ -32,16 +32,26 @@ def _severity_value(payload: object) -> str:
     return severity.lower() if isinstance(severity, str) else ""
 
 
+_SEVERITY_RANK = {"low": 1, "medium": 2, "high": 3, "critical": 4}
+
+
+def _row_severity(row: JSONDict) -> int:
+    return max(
+        _SEVERITY_RANK.get(_severity_value(row.get("forecast")), 0),
+        _SEVERITY_RANK.get(_severity_value(row.get("degradation")), 0),
+    )
+
+
 @router.post(
     "/forecast/trajectory",
     summary="Time-to-failure and degradation trajectory per metric",
+    response_class=OrjsonResponse,
     dependencies=[Depends(require_permission_dependency("read:rca"))],
 )
-@handle_exceptions
 async def metric_trajectory(
     req: CorrelateRequest,
     limit: int = Query(default=100, ge=1, le=2000),
-) -> JSONDict:
+) -> OrjsonResponse:
     limit = coerce_query_value(limit, int)
     req = enforce_request_tenant(req)
     provider = get_provider(req.tenant_id)
@@ -61,9 +71,4 @@ async def metric_trajectory(
                     "forecast": f.__dict__ if f else None,
                     "degradation": deg.__dict__ if deg else None,
                 })
-    severity_rank = {"low": 1, "medium": 2, "high": 3, "critical": 4}
-    results.sort(key=lambda row: max(
-        severity_rank.get(_severity_value(row.get("forecast")), 0),
-        severity_rank.get(_severity_value(row.get("degradation")), 0),
-    ), reverse=True)
-    return {"results": results[:limit]}
+    return OrjsonResponse({"results": heapq.nlargest(limit, results, key=_row_severity)})
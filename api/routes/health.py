@@ -11,14 +11,12 @@ from __future__ import annotations
 
 from fastapi import APIRouter
 from store.client import get_redis, is_using_fallback
-from api.routes.exception import handle_exceptions
 from custom_types.json import JSONDict
 
 router = APIRouter(tags=["Health"])
 
 
 @router.get("/health")
-@handle_exceptions
 async def health() -> JSONDict:
     await get_redis()
     return {
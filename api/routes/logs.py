@@ -12,8 +12,7 @@ from __future__ import annotations
 
 from typing import List
 from fastapi import APIRouter, Depends
-from api.routes.common import get_provider, safe_call, to_nanoseconds
-from api.routes.exception import handle_exceptions
+from api.routes.common import get_provider, to_nanoseconds, upstream_errors
 from services.security_service import enforce_request_tenant, require_permission_dependency
 from engine import logs
 from api.requests import LogRequest
@@ -27,14 +26,13 @@ router = APIRouter(tags=["Logs"])
     response_model=List[LogPattern],
     dependencies=[Depends(require_permission_dependency("read:rca"))],
 )
-@handle_exceptions
 async def log_patterns(req: LogRequest) -> List[LogPattern]:
     req = enforce_request_tenant(req)
-    raw = await safe_call(
-        get_provider(req.tenant_id).query_logs(
+    provider = get_provider(req.tenant_id)
+    with upstream_errors():
+        raw = await provider.query_logs(
             query=req.query, start=to_nanoseconds(req.start), end=to_nanoseconds(req.end)
         )
-    )
     return logs.analyze(raw)
 
 
@@ -43,12 +41,11 @@ async def log_patterns(req: LogRequest) -> List[LogPattern]:
     response_model=List[LogBurst],
     dependencies=[Depends(require_permission_dependency("read:rca"))],
 )
-@handle_exceptions
 async def log_bursts(req: LogRequest) -> List[LogBurst]:
     req = enforce_request_tenant(req)
-    raw = await safe_call(
-        get_provider(req.tenant_id).query_logs(
+    provider = get_provider(req.tenant_id)
+    with upstream_errors():
+        raw = await provider.query_logs(
             query=req.query, start=to_nanoseconds(req.start), end=to_nanoseconds(req.end)
         )
-    )
     return logs.detect_bursts(raw)
@@ -9,36 +9,55 @@ You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2
 
 from __future__ import annotations
 
+import asyncio
+from operator import attrgetter
 from typing import List
 from fastapi import APIRouter, Depends
-from api.routes.common import get_provider, safe_call
-from api.routes.exception import handle_exceptions
+from api.routes.common import get_provider, upstream_errors
 from services.security_service import enforce_request_tenant, require_permission_dependency
 from engine import anomaly
 from engine.changepoint import detect as changepoint_detect, ChangePoint
 from api.requests import MetricRequest, ChangepointRequest
 from api.responses import MetricAnomaly
+from custom_types.json import JSONDict
 
 router = APIRouter(tags=["Metrics"])
+_by_timestamp = attrgetter("timestamp")
+
+
+def _detect_changepoints(raw: JSONDict, query: str, threshold_sigma: float) -> List[ChangePoint]:
+    results: List[ChangePoint] = []
+    for metric_name, ts, vals in anomaly.iter_series(raw, query_hint=query):
+        try:
+            results.extend(
+                changepoint_detect(
+                    ts,
+                    vals,
+                    threshold_sigma=threshold_sigma,
+                    metric_name=metric_name,
+                )
+            )
+        except TypeError:
+            results.extend(changepoint_detect(ts, vals, threshold_sigma))
+    return results
+
 
 @router.post(
     "/anomalies/metrics",
     response_model=List[MetricAnomaly],
     dependencies=[Depends(require_permission_dependency("read:rca"))],
 )
-@handle_exceptions
 async def metric_anomalies(req: MetricRequest) -> List[MetricAnomaly]:
     req = enforce_request_tenant(req)
-    raw = await safe_call(
-        get_provider(req.tenant_id).query_metrics(
+    provider = get_provider(req.tenant_id)
+    with upstream_errors():
+        raw = await provider.query_metrics(
             query=req.query, start=req.start, end=req.end, step=req.step
         )
-    )
 
-    results = []
-    for metric, ts, vals in anomaly.iter_series(raw, query_hint=req.query):
-        results.extend(anomaly.detect(metric, ts, vals, req.sensitivity))
-    return sorted(results, key=lambda a: a.timestamp)
+    # Detection is CPU-bound; run it in a worker so other requests keep being served.
+    results = await asyncio.to_thread(anomaly.detect_batch, [(req.query, raw)], req.sensitivity)
+    return sorted(results, key=_by_timestamp)
 
 
 @router.post(
@@ -46,27 +65,13 @@ async def metric_anomalies(req: MetricRequest) -> List[MetricAnomaly]:
     response_model=List[ChangePoint],
     dependencies=[Depends(require_permission_dependency("read:rca"))],
 )
-@handle_exceptions
 async def metric_changepoints(req: ChangepointRequest) -> List[ChangePoint]:
     req = enforce_request_tenant(req)
-    raw = await safe_call(
-        get_provider(req.tenant_id).query_metrics(
+    provider = get_provider(req.tenant_id)
+    with upstream_errors():
+        raw = await provider.query_metrics(
             query=req.query, start=req.start, end=req.end, step=req.step
         )
-    )
 
-    results: List[ChangePoint] = []
-    for metric_name, ts, vals in anomaly.iter_series(raw, query_hint=req.query):
-        threshold_sigma = float(req.threshold_sigma)
-        try:
-            results.extend(
-                changepoint_detect(
-                    ts,
-                    vals,
-                    threshold_sigma=threshold_sigma,
-                    metric_name=metric_name,
-                )
-            )
-        except TypeError:
-            results.extend(changepoint_detect(ts, vals, threshold_sigma))
-    return sorted(results, key=lambda c: c.timestamp)
+    results = await asyncio.to_thread(_detect_changepoints, raw, req.query, float(req.threshold_sigma))
+    return sorted(results, key=_by_timestamp)
@@ -11,8 +11,7 @@ from __future__ import annotations
 
 from fastapi import APIRouter, Depends, HTTPException
 
-from api.routes.common import safe_call
-from api.routes.exception import handle_exceptions
+from api.routes.common import upstream_errors
 from engine.enums import Signal
 from engine.registry import get_registry
 from services.security_service import get_context_tenant, require_permission_dependency
@@ -26,7 +25,6 @@ router = APIRouter(tags=["ML"])
     summary="Submit signal correctness feedback",
     dependencies=[Depends(require_permission_dependency("create:rca"))],
 )
-@handle_exceptions
 async def signal_feedback(tenant_id: str, signal: str, was_correct: bool) -> JSONDict:
     tenant_id = get_context_tenant(tenant_id)
     try:
@@ -36,7 +34,8 @@ async def signal_feedback(tenant_id: str, signal: str, was_correct: bool) -> JSO
             status_code=400,
             detail=f"Unknown signal '{signal}'. Valid values: {[s.value for s in Signal]}",
         ) from exc
-    state = await safe_call(get_registry().update_weight(tenant_id, sig, was_correct), 500)
+    with upstream_errors(500):
+        state = await get_registry().update_weight(tenant_id, sig, was_correct)
     return {"updated_weights": state.weights_serializable, "update_count": state.update_count}
 
 
@@ -45,10 +44,10 @@ async def signal_feedback(tenant_id: str, signal: str, was_correct: bool) -> JSO
     summary="Current adaptive signal weights for a tenant",
     dependencies=[Depends(require_permission_dependency("read:rca"))],
 )
-@handle_exceptions
 async def get_signal_weights(tenant_id: str) -> JSONDict:
     tenant_id = get_context_tenant(tenant_id)
-    state = await safe_call(get_registry().get_state(tenant_id), 500)
+    with upstream_errors(500):
+        state = await get_registry().get_state(tenant_id)
     return {"weights": state.weights_serializable, "update_count": state.update_count}
 
 
@@ -57,8 +56,8 @@ async def get_signal_weights(tenant_id: str) -> JSONDict:
     summary="Reset adaptive weights to defaults for a tenant",
     dependencies=[Depends(require_permission_dependency("delete:rca"))],
 )
-@handle_exceptions
 async def reset_signal_weights(tenant_id: str) -> JSONDict:
     tenant_id = get_context_tenant(tenant_id)
-    state = await safe_call(get_registry().reset_weights(tenant_id), 500)
+    with upstream_errors(500):
+        state = await get_registry().reset_weights(tenant_id)
     return {"weights": state.weights_serializable, "update_count": state.update_count}
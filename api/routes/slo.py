@@ -9,58 +9,62 @@ You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2
 
 from __future__ import annotations
 
+import asyncio
 import logging
+from functools import lru_cache
+from itertools import zip_longest
 from fastapi import APIRouter, Depends
-from api.routes.common import get_provider, safe_call
-from api.routes.exception import handle_exceptions
+from api.routes.common import OrjsonResponse, get_provider, upstream_errors
 from services.security_service import enforce_request_tenant, require_permission_dependency
 from engine import anomaly
-from engine.slo import evaluate as slo_evaluate, remaining_minutes
+from engine.slo import BudgetStatus, SloBurnAlert, evaluate as slo_evaluate, remaining_minutes
 from api.requests import SloRequest
 from config import settings
-from custom_types.json import JSONDict
 
 router = APIRouter(tags=["SLO"])
 log = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=256)
+def _slo_query(template: str, service: str) -> str:
+    return template.format(service=service)
+
+
 @router.post(
     "/slo/burn",
     summary="SLO error budget burn rate",
+    response_class=OrjsonResponse,
     dependencies=[Depends(require_permission_dependency("read:rca"))],
 )
-@handle_exceptions
-async def slo_burn(req: SloRequest) -> JSONDict:
+async def slo_burn(req: SloRequest) -> OrjsonResponse:
     req = enforce_request_tenant(req)
-    error_q = req.error_query or settings.slo_error_query_template.format(service=req.service)
-    total_q = req.total_query or settings.slo_total_query_template.format(service=req.service)
+    error_q = req.error_query or _slo_query(settings.slo_error_query_template, req.service)
+    total_q = req.total_query or _slo_query(settings.slo_total_query_template, req.service)
     provider = get_provider(req.tenant_id)
 
-    err_raw = await safe_call(
-        provider.query_metrics(query=error_q, start=req.start, end=req.end, step=req.step)
-    )
-    tot_raw = await safe_call(
-        provider.query_metrics(query=total_q, start=req.start, end=req.end, step=req.step)
-    )
-
-    err_series = list(anomaly.iter_series(err_raw, query_hint=error_q))
-    tot_series = list(anomaly.iter_series(tot_raw, query_hint=total_q))
-
-    alerts = []
-    budget = None
-    if len(err_series) != len(tot_series):
-        log.warning(
-            "SLO series mismatch for tenant=%s service=%s errors=%d totals=%d",
-            req.tenant_id,
-            req.service,
-            len(err_series),
-            len(tot_series),
+    with upstream_errors():
+        err_raw, tot_raw = await asyncio.gather(
+            provider.query_metrics(query=error_q, start=req.start, end=req.end, step=req.step),
+            provider.query_metrics(query=total_q, start=req.start, end=req.end, step=req.step),
         )
 
-    pair_count = min(len(err_series), len(tot_series))
-    for idx in range(pair_count):
-        _, err_ts, err_vals = err_series[idx]
-        _, _tot_ts, tot_vals = tot_series[idx]
+    alerts: list[SloBurnAlert] = []
+    budget: BudgetStatus | None = None
+    err_count = tot_count = pair_count = 0
+    err_vals: list[float] = []
+    tot_vals: list[float] = []
+    for err_item, tot_item in zip_longest(
+        anomaly.iter_series(err_raw, query_hint=error_q),
+        anomaly.iter_series(tot_raw, query_hint=total_q),
+    ):
+        err_count += err_item is not None
+        tot_count += tot_item is not None
+        if err_item is None or tot_item is None:
+            continue
+        idx = pair_count
+        pair_count += 1
+        _, err_ts, err_vals = err_item
+        _, _tot_ts, tot_vals = tot_item
         if len(err_vals) != len(tot_vals):
             n = min(len(err_vals), len(tot_vals))
             log.warning(
@@ -75,9 +79,18 @@ async def slo_burn(req: SloRequest) -> JSONDict:
             tot_vals = tot_vals[:n]
             err_ts = err_ts[:n]
         alerts.extend(slo_evaluate(req.service, err_vals, tot_vals, err_ts, req.target_availability))
+
+    if err_count != tot_count:
+        log.warning(
+            "SLO series mismatch for tenant=%s service=%s errors=%d totals=%d",
+            req.tenant_id,
+            req.service,
+            err_count,
+            tot_count,
+        )
+
+    # Only the last pair's budget is reported, so it is computed once after the loop.
+    if pair_count:
         budget = remaining_minutes(req.service, err_vals, tot_vals, req.target_availability)
 
-    return {
-        "burn_alerts": [a.__dict__ for a in alerts],
-        "budget_status": budget.__dict__ if budget else None,
-    }
+    return OrjsonResponse({"burn_alerts": alerts, "budget_status": budget})
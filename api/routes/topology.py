@@ -10,8 +10,7 @@ You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2
 from __future__ import annotations
 
 from fastapi import APIRouter, Depends
-from api.routes.common import get_provider, safe_call
-from api.routes.exception import handle_exceptions
+from api.routes.common import get_provider, upstream_errors
 from services.security_service import enforce_request_tenant, require_permission_dependency
 from engine.topology import DependencyGraph
 from api.requests import TopologyRequest
@@ -25,14 +24,13 @@ router = APIRouter(tags=["Topology"])
     summary="Service dependency blast radius from traces",
     dependencies=[Depends(require_permission_dependency("read:rca"))],
 )
-@handle_exceptions
 async def blast_radius(req: TopologyRequest) -> JSONDict:
     req = enforce_request_tenant(req)
-    raw = await safe_call(
-        get_provider(req.tenant_id).query_traces(
+    provider = get_provider(req.tenant_id)
+    with upstream_errors():
+        raw = await provider.query_traces(
             filters={}, start=req.start, end=req.end
         )
-    )
 
     graph = DependencyGraph()
     graph.from_spans(raw)
@@ -11,8 +11,7 @@ from __future__ import annotations
 
 from typing import List
 from fastapi import APIRouter, Depends
-from api.routes.common import get_provider, safe_call
-from api.routes.exception import handle_exceptions
+from api.routes.common import get_provider, upstream_errors
 from services.security_service import enforce_request_tenant, require_permission_dependency
 from engine import traces
 from api.requests import TraceRequest
@@ -27,15 +26,14 @@ router = APIRouter(tags=["Traces"])
     response_model=List[ServiceLatency],
     dependencies=[Depends(require_permission_dependency("read:rca"))],
 )
-@handle_exceptions
 async def trace_anomalies(req: TraceRequest) -> List[ServiceLatency]:
     req = enforce_request_tenant(req)
     filters: TraceFilters = {}
     if req.service:
         filters["service.name"] = req.service
-    raw = await safe_call(
-        get_provider(req.tenant_id).query_traces(
+    provider = get_provider(req.tenant_id)
+    with upstream_errors():
+        raw = await provider.query_traces(
             filters=filters, start=req.start, end=req.end
         )
-    )
     return traces.analyze(raw, req.apdex_threshold_ms)
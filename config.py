@@ -78,6 +78,7 @@ BECERTAIN_TRACES_TEMPO_URL = os.getenv("BECERTAIN_TRACES_TEMPO_URL", "http://tem
 
 BECERTAIN_CONNECTOR_TIMEOUT = int(os.getenv("BECERTAIN_CONNECTOR_TIMEOUT", "10"))
 BECERTAIN_STARTUP_TIMEOUT = int(os.getenv("BECERTAIN_STARTUP_TIMEOUT", "120"))
+BECERTAIN_MAX_CONCURRENT_QUERIES = int(os.getenv("BECERTAIN_MAX_CONCURRENT_QUERIES", "8"))
 BECERTAIN_HOST = os.getenv("BECERTAIN_HOST", "127.0.0.1")
 BECERTAIN_PORT = int(os.getenv("BECERTAIN_PORT", "4322"))
 BECERTAIN_EXPECTED_SERVICE_TOKEN = os.getenv("BECERTAIN_EXPECTED_SERVICE_TOKEN", "")
@@ -22,6 +22,7 @@ class BaseConnector(ABC):
         self.base_url = str(base_url).rstrip("/")
         self.timeout = timeout
         self.headers = headers or {}
+        self._request_headers = {**self.headers, "X-Scope-OrgID": self.tenant_id}
         self.client = httpx.AsyncClient(timeout=self.timeout)
 
     @property
@@ -31,7 +32,7 @@ class BaseConnector(ABC):
         return f"{self.base_url}{self.health_path}"
 
     def _headers(self) -> dict[str, str]:
-        return {**self.headers, "X-Scope-OrgID": self.tenant_id}
+        return self._request_headers
 
     async def aclose(self) -> None:
         await self.client.aclose()
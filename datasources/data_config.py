@@ -24,6 +24,7 @@ from config import (
     BECERTAIN_TRACES_TEMPO_URL,
     BECERTAIN_CONNECTOR_TIMEOUT,
     BECERTAIN_STARTUP_TIMEOUT,
+    BECERTAIN_MAX_CONCURRENT_QUERIES,
 )
 
 class DataSourceSettings(BaseSettings):
@@ -36,6 +37,7 @@ class DataSourceSettings(BaseSettings):
     victoriametrics_url: Optional[str] = BECERTAIN_METRICS_VICTORIAMETRICS_URL
     connector_timeout: int = BECERTAIN_CONNECTOR_TIMEOUT
     startup_timeout: int = BECERTAIN_STARTUP_TIMEOUT
+    max_concurrent_queries: int = BECERTAIN_MAX_CONCURRENT_QUERIES
     @field_validator("loki_url", "mimir_url", "tempo_url", "victoriametrics_url", mode="before")
     @classmethod
     def strip_trailing_slash(cls, v: Optional[str]) -> Optional[str]:
@@ -12,6 +12,7 @@ from __future__ import annotations
 
 from typing import Optional
 import httpx
+import orjson
 from datasources.exceptions import DataSourceUnavailable, InvalidQuery, QueryTimeout
 from datasources.types import JSONDict, QueryParams
 
@@ -33,7 +34,7 @@ async def fetch_json(
         else:
             resp = await client.get(url, params=params, headers=headers)
         resp.raise_for_status()
-        payload = resp.json()
+        payload = orjson.loads(resp.content)
         return payload if isinstance(payload, dict) else {}
     except httpx.HTTPStatusError as e:
         raise InvalidQuery(f"{invalid_msg} [{e.response.status_code}]: {e.response.text}") from e
@@ -856,14 +856,16 @@ async def run(provider: DataSourceProvider, req: AnalyzeRequest) -> AnalysisRepo
     else:
         z_threshold = settings.baseline_zscore_threshold
 
+    start_ns = req.start * 1_000_000_000
+    end_ns = req.end * 1_000_000_000
     fetch_started = time.perf_counter()
     try:
         logs_raw, traces_raw, slo_errors_raw, slo_total_raw = await asyncio.wait_for(
             asyncio.gather(
                 provider.query_logs(
                     query=log_query,
-                    start=req.start * 1_000_000_000,
-                    end=req.end * 1_000_000_000,
+                    start=start_ns,
+                    end=end_ns,
                 ),
                 provider.query_traces(filters=trace_filters, start=req.start, end=req.end),
                 provider.query_metrics(query=SLO_ERROR_QUERY, start=req.start, end=req.end, step=req.step),
@@ -960,8 +962,8 @@ async def run(provider: DataSourceProvider, req: AnalyzeRequest) -> AnalysisRepo
                 try:
                     fallback_logs = await provider.query_logs(
                         query=selector,
-                        start=req.start * 1_000_000_000,
-                        end=req.end * 1_000_000_000,
+                        start=start_ns,
+                        end=end_ns,
                     )
                 except _RECOVERABLE_ANALYSIS_ERRORS as exc:
                     log.debug("Logs fallback selector failed query=%s error=%s", selector, exc)
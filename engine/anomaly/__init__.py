@@ -8,7 +8,7 @@ you may not use this file except in compliance with the License.
 You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
 """
 
-from engine.anomaly.detection import detect
+from engine.anomaly.detection import detect, detect_batch
 from engine.anomaly.series import iter_series
 
-__all__ = ["detect", "iter_series"]
+__all__ = ["detect", "detect_batch", "iter_series"]
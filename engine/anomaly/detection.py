@@ -12,19 +12,22 @@ from __future__ import annotations
 
 from importlib import import_module
 import math
-from typing import Callable, List, Protocol
+from typing import Callable, Iterable, List, Protocol, Tuple
 
 import numpy as np
 
 from engine.enums import ChangeType, Severity
 from api.responses import MetricAnomaly
+from engine.anomaly.series import WrappedMimirResponse, iter_series
 from config import settings
 
 linregress: Callable[[np.ndarray, np.ndarray], tuple[float, float, float, float, float]] = import_module("scipy.stats").linregress
 
 
 class IsolationForestModel(Protocol):
-    def fit_predict(self, data: np.ndarray) -> np.ndarray: ...
+    offset_: float
+
+    def fit(self, data: np.ndarray) -> IsolationForestModel: ...
     def score_samples(self, data: np.ndarray) -> np.ndarray: ...
 
 
@@ -224,30 +227,29 @@ def detect(
         random_state=settings.anomaly_iso_random_state,
         n_estimators=settings.anomaly_iso_n_estimators,
     )
-    iso_labels = iso.fit_predict(arr.reshape(-1, 1))
-    iso_scores = iso.score_samples(arr.reshape(-1, 1))
+    samples = arr.reshape(-1, 1)
+    iso_scores = iso.fit(samples).score_samples(samples)
+    # Same labels as fit_predict, without scoring every sample a second time.
+    iso_labels = np.where(iso_scores - iso.offset_ < 0, -1, 1)
 
     slope, *_ = linregress(np.arange(len(clean)), clean)
 
+    abs_z = np.abs(z_scores)
+    abs_m = np.abs(mad_scores)
+    stat_flags = (
+        (abs_z >= settings.zscore_threshold)
+        | (abs_m >= settings.mad_threshold)
+        | cusum_flags
+    )
+    iso_flags = (iso_labels == -1) & (
+        (abs_z >= settings.zscore_threshold * 0.7)
+        | (abs_m >= settings.mad_threshold * 0.7)
+    )
+
     anomalies: List[MetricAnomaly] = []
-    for t, v, z, m, c, iso_l, iso_s in (
-        zip(ts, arr, z_scores, mad_scores, cusum_flags, iso_labels, iso_scores)
-    ):
-        stat_flag = (
-            abs(z) >= settings.zscore_threshold
-            or abs(m) >= settings.mad_threshold
-            or c
-        )
-        iso_flag = (
-            iso_l == -1
-            and (
-                abs(z) >= settings.zscore_threshold * 0.7
-                or abs(m) >= settings.mad_threshold * 0.7
-            )
-        )
-        flagged = stat_flag or iso_flag
-        if not flagged:
-            continue
+    for i in np.flatnonzero(stat_flags | iso_flags):
+        t, v, z, m = ts[i], arr[i], z_scores[i], mad_scores[i]
+        iso_l, iso_s = iso_labels[i], iso_scores[i]
 
         sev = _severity(z, m, iso_l)
         ctype = _change_type(v, mean, z, slope)
@@ -271,3 +273,14 @@ def detect(
     if bool(settings.anomaly_compress_runs):
         anomalies = _compress_runs(anomalies)
     return _apply_density_cap(anomalies, ts)
+
+
+def detect_batch(
+    metrics_raw: Iterable[Tuple[str, WrappedMimirResponse]],
+    sensitivity: float | None = None,
+) -> List[MetricAnomaly]:
+    anomalies: List[MetricAnomaly] = []
+    for query_string, resp in metrics_raw:
+        for metric_name, ts, vals in iter_series(resp, query_hint=query_string):
+            anomalies.extend(detect(metric_name, ts, vals, sensitivity))
+    return anomalies
@@ -12,6 +12,7 @@ from __future__ import annotations
 
 import logging
 import re
+import sys
 from collections.abc import Mapping
 from typing import Iterator, Optional, TypeAlias
 
@@ -155,7 +156,7 @@ def iter_series(
             label_parts.append(f"{key}={text}")
             if len(label_parts) >= 3:
                 break
-        label = f"{base}{{{','.join(label_parts)}}}" if label_parts else base
+        label = sys.intern(f"{base}{{{','.join(label_parts)}}}" if label_parts else base)
 
         pairs = result.get("values")
         if not isinstance(pairs, list) or not pairs:
@@ -11,13 +11,18 @@ You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Dict, List
+from typing import Dict, List, Tuple
 
 from engine.enums import RcaCategory
 
 
 from config import settings
 
+_Evidence = Tuple[bool, bool, bool, bool, bool]
+_score_cache: Dict[_Evidence, List["BayesianScore"]] = {}
+_score_cache_source: List[object] = []
+
+
 def _configured_priors() -> Dict[RcaCategory, float]:
     return {RcaCategory(k): v for k, v in settings.bayesian_priors.items()}
 
@@ -34,12 +39,48 @@ class BayesianScore:
     likelihood: float
 
 
+def _cached_scores(key: _Evidence) -> List[BayesianScore] | None:
+    source = [
+        settings.bayesian_priors,
+        settings.bayesian_likelihoods,
+        settings.bayesian_default_feature_prob,
+    ]
+    if len(_score_cache_source) != len(source) or any(
+        cached is not current for cached, current in zip(_score_cache_source, source)
+    ):
+        _score_cache.clear()
+        _score_cache_source[:] = source
+        return None
+    return _score_cache.get(key)
+
+
 def score(
     has_deployment_event: bool,
     has_metric_spike: bool,
     has_log_burst: bool,
     has_latency_spike: bool,
     has_error_propagation: bool,
+) -> List[BayesianScore]:
+    key: _Evidence = (
+        bool(has_deployment_event),
+        bool(has_metric_spike),
+        bool(has_log_burst),
+        bool(has_latency_spike),
+        bool(has_error_propagation),
+    )
+    cached = _cached_scores(key)
+    if cached is None:
+        cached = _score(*key)
+        _score_cache[key] = cached
+    return list(cached)
+
+
+def _score(
+    has_deployment_event: bool,
+    has_metric_spike: bool,
+    has_log_burst: bool,
+    has_latency_spike: bool,
+    has_error_propagation: bool,
 ) -> List[BayesianScore]:
     evidence: Dict[str, bool] = {
         "has_deployment_event": has_deployment_event,
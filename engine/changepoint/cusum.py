@@ -72,18 +72,25 @@ def detect(
 
     oscillation_indices = set(_detect_oscillation(arr))
 
-    k = settings.cusum_k * sigma
-    h = threshold_sigma * sigma
+    # The scan runs on plain floats; indexing numpy scalars per step is several times slower.
+    values = arr.tolist()
+    mu_f = float(mu)
+    k = float(settings.cusum_k * sigma)
+    h = float(threshold_sigma * sigma)
     cusum_pos = cusum_neg = 0.0
     results: List[ChangePoint] = []
 
-    for i in range(1, len(arr)):
-        cusum_pos = max(0.0, cusum_pos + arr[i] - mu - k)
-        cusum_neg = max(0.0, cusum_neg - arr[i] + mu - k)
+    for i, x in enumerate(values[1:], start=1):
+        cusum_pos = cusum_pos + x - mu_f - k
+        cusum_neg = cusum_neg - x + mu_f - k
+        cusum_pos = cusum_pos if cusum_pos > 0.0 else 0.0
+        cusum_neg = cusum_neg if cusum_neg > 0.0 else 0.0
 
         if cusum_pos > h or cusum_neg > h:
-            before = float(np.mean(arr[max(0, i - 5):i]))
-            after = float(np.mean(arr[i:min(len(arr), i + 5)]))
+            window_before = values[max(0, i - 5):i]
+            window_after = values[i:i + 5]
+            before = sum(window_before) / len(window_before)
+            after = sum(window_after) / len(window_after)
             ctype = ChangeType.oscillation if i in oscillation_indices else _classify(before, after, sigma)
             results.append(ChangePoint(
                 index=i,
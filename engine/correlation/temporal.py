@@ -13,7 +13,9 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 import math
 import re
-from typing import List, Set, Callable
+from typing import List, Callable
+
+import numpy as np
 
 from api.responses import MetricAnomaly, LogBurst, ServiceLatency
 from config import settings
@@ -115,27 +117,38 @@ def correlate(
     if not anchor_times:
         return []
 
+    metric_ts = np.array([a.timestamp for a in metric_anomalies], dtype=float)
+    metric_order = np.argsort(metric_ts, kind="stable")
+    sorted_metric_ts = metric_ts[metric_order]
+
+    burst_positions: list[int] = []
+    burst_bounds: list[tuple[float, float]] = []
+    for position, burst in enumerate(log_bursts):
+        burst_start = _safe_float(getattr(burst, "start", getattr(burst, "window_start", None)))
+        burst_end = _safe_float(getattr(burst, "end", getattr(burst, "window_end", None)))
+        if burst_start is None or burst_end is None:
+            continue
+        burst_positions.append(position)
+        burst_bounds.append((burst_start, burst_end))
+    burst_index = np.array(burst_positions, dtype=np.intp)
+    burst_starts = np.array([start for start, _ in burst_bounds], dtype=float)
+    burst_ends = np.array([end for _, end in burst_bounds], dtype=float)
+
     events: List[CorrelatedEvent] = []
-    used: Set[float] = set()
+    covered_until = -math.inf
 
     for anchor in anchor_times:
-        if anchor in used:
+        if anchor <= covered_until:
             continue
 
         w_start = anchor - window_seconds
         w_end = anchor + window_seconds
 
-        ma = [a for a in metric_anomalies if w_start <= a.timestamp <= w_end]
-        lb = []
-        for burst in log_bursts:
-            burst_start = getattr(burst, "start", getattr(burst, "window_start", None))
-            burst_end = getattr(burst, "end", getattr(burst, "window_end", None))
-            burst_start = _safe_float(burst_start)
-            burst_end = _safe_float(burst_end)
-            if burst_start is None or burst_end is None:
-                continue
-            if _overlap(w_start, w_end, burst_start, burst_end):
-                lb.append(burst)
+        lo = int(np.searchsorted(sorted_metric_ts, w_start, side="left"))
+        hi = int(np.searchsorted(sorted_metric_ts, w_end, side="right"))
+        ma = [metric_anomalies[i] for i in np.sort(metric_order[lo:hi])]
+        in_window = (burst_starts <= w_end) & (w_start <= burst_ends)
+        lb = [log_bursts[i] for i in burst_index[in_window]]
         metric_services: set[str] = set()
         for anomaly in ma:
             metric_services.update(_service_tokens_from_metric_name(getattr(anomaly, "metric_name", "")))
@@ -182,8 +195,6 @@ def correlate(
             confidence=confidence,
         ))
 
-        for a in anchor_times:
-            if w_start <= a <= w_end:
-                used.add(a)
+        covered_until = w_end
 
     return sorted(events, key=lambda e: e.confidence, reverse=True)
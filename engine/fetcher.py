@@ -13,6 +13,8 @@ from __future__ import annotations
 import asyncio
 import logging
 import re
+import sys
+from contextlib import nullcontext
 from typing import Dict, List, Tuple
 
 import httpx
@@ -55,7 +57,7 @@ async def _scrape_and_fill(
         parts = line.split()
         if len(parts) < 2:
             continue
-        name = parts[0].split("{", 1)[0]
+        name = sys.intern(parts[0].split("{", 1)[0])
         try:
             metrics[name] = float(parts[1])
         except ValueError:
@@ -90,12 +92,14 @@ async def fetch_metrics(
     start: int,
     end: int,
     step: str,
+    *,
+    limiter: asyncio.Semaphore | None = None,
 ) -> List[Tuple[str, JSONDict]]:
     max_parallel = max(1, int(settings.analyzer_max_parallel_metric_queries))
     sem = asyncio.Semaphore(max_parallel)
 
     async def _query(q: str) -> JSONDict:
-        async with sem:
+        async with sem, limiter or nullcontext():
             return await provider.query_metrics(query=q, start=start, end=end, step=step)
 
     raw = await asyncio.gather(*[_query(q) for q in queries], return_exceptions=True)
@@ -3,14 +3,21 @@
 from __future__ import annotations
 
 import re
+from functools import lru_cache
+
+_MATCH_ALL_RE = re.compile(r'=~"\.\*"')
+
+
+@lru_cache(maxsize=1024)
+def _service_selector(services: tuple[str, ...]) -> str:
+    escaped = [re.escape(service) for service in services if service]
+    if escaped:
+        return f'{{service_name=~"{"|".join(escaped)}"}}'
+    return '{service_name=~".+"}'
 
 
 def build_log_query(services: list[str] | None, requested_log_query: str | None) -> str:
     requested = (requested_log_query or "").strip()
     if requested:
-        return re.sub(r'=~"\.\*"', '=~".+"', requested)
-    if services:
-        escaped = [re.escape(service) for service in services if service]
-        if escaped:
-            return '{service_name=~"' + "|".join(escaped) + '"}'
-    return '{service_name=~".+"}'
+        return _MATCH_ALL_RE.sub('=~".+"', requested)
+    return _service_selector(tuple(services or ()))
@@ -82,22 +82,18 @@ def detect_bursts(loki_response: Mapping[str, object], window_seconds: float | N
 
     baseline_rate = len(timestamps) / total_duration
 
-    windows: List[Tuple[float, float, int, bool]] = []
+    windows: List[Tuple[int, int]] = []
     i = 0
     while i < len(timestamps):
-        w_start = timestamps[i]
-        w_end = w_start + window_seconds
-        end_idx = int(np.searchsorted(timestamps, w_end, side="left"))
-        count = end_idx - i
-        lines = [entry[1] for entry in entries[i:end_idx]]
-        windows.append((w_start, w_end, count, _is_benign_repetitive_window(lines)))
-        i += max(1, count)
-
-    if not windows:
-        return []
+        end_idx = int(np.searchsorted(timestamps, timestamps[i] + window_seconds, side="left"))
+        windows.append((i, end_idx))
+        i = max(i + 1, end_idx)
 
     bursts: List[LogBurst] = []
-    for w_start, w_end, count, benign_window in windows:
+    for first, end_idx in windows:
+        count = end_idx - first
+        w_start = timestamps[first]
+        w_end = w_start + window_seconds
         rate = count / window_seconds
         ratio = rate / baseline_rate if baseline_rate > 0 else 0.0
         severity = next(
@@ -106,7 +102,8 @@ def detect_bursts(loki_response: Mapping[str, object], window_seconds: float | N
         )
         if severity is None:
             continue
-        if benign_window:
+        # Line content only matters for windows that already qualify as bursts.
+        if _is_benign_repetitive_window([entry[1] for entry in entries[first:end_idx]]):
             severity = Severity.low
         bursts.append(LogBurst(
             window_start=w_start,
@@ -61,7 +61,7 @@ def _iter_entries(loki_response: Mapping[str, object]) -> Iterator[Tuple[float,
 
 
 def _normalize(line: str) -> str:
-    return re.sub(r"\s+", " ", _NOISE.sub("<_>", line)).strip()[: settings.logs_normalized_length_cutoff]
+    return " ".join(_NOISE.sub("<_>", line).split())[: settings.logs_normalized_length_cutoff]
 
 
 def _classify(line: str) -> Severity:
@@ -10,9 +10,10 @@ You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2
 
 from __future__ import annotations
 
+import asyncio
 import math
 import logging
-from typing import Dict, List, Union
+from typing import Dict, List, Sequence, Tuple, Union
 
 from engine.enums import Signal
 from store import events as event_store, weights as weight_store
@@ -147,6 +148,8 @@ class TenantState:
 class TenantRegistry:
     def __init__(self) -> None:
         self._states: Dict[str, TenantState] = {}
+        self._pending_events: Dict[str, List[Tuple[DeploymentEvent, asyncio.Future[None]]]] = {}
+        self._event_flushes: Dict[str, asyncio.Task[None]] = {}
 
     async def get_state(self, tenant_id: str) -> TenantState:
         if tenant_id not in self._states:
@@ -182,7 +185,34 @@ class TenantRegistry:
         return state
 
     async def register_event(self, tenant_id: str, event: DeploymentEvent) -> None:
-        await event_store.append(tenant_id, event)
+        """Persist ``event`` once it has been written alongside any other
+        registrations for the same tenant that arrive while a write is in
+        flight.  Callers still only return after their own event is stored.
+        """
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._pending_events.setdefault(tenant_id, []).append((event, waiter))
+        if tenant_id not in self._event_flushes:
+            self._event_flushes[tenant_id] = asyncio.create_task(self._flush_events(tenant_id))
+        await waiter
+
+    async def register_events_bulk(self, tenant_id: str, events: Sequence[DeploymentEvent]) -> None:
+        await event_store.append_many(tenant_id, events)
+
+    async def _flush_events(self, tenant_id: str) -> None:
+        try:
+            while batch := self._pending_events.pop(tenant_id, None):
+                try:
+                    await self.register_events_bulk(tenant_id, [event for event, _ in batch])
+                except Exception as exc:
+                    for _, waiter in batch:
+                        if not waiter.done():
+                            waiter.set_exception(exc)
+                else:
+                    for _, waiter in batch:
+                        if not waiter.done():
+                            waiter.set_result(None)
+        finally:
+            self._event_flushes.pop(tenant_id, None)
 
     async def get_events(self, tenant_id: str) -> List[event_store.StoredEvent]:
         return await event_store.load(tenant_id)
@@ -7,7 +7,7 @@ from dataclasses import dataclass
 from engine.enums import Severity
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SloBurnAlert:
     service: str
     window_label: str
@@ -17,7 +17,7 @@ class SloBurnAlert:
     severity: Severity
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BudgetStatus:
     service: str
     target_availability: float
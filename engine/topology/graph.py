@@ -83,6 +83,8 @@ class DependencyGraph:
                     "db.name",
                 )
                 for span in _spans(span_set.get("spans")):
+                    if svc and peer:
+                        break
                     attrs = _attributes(span.get("attributes"))
                     if not svc:
                         svc = _attr_value(attrs, "service.name")
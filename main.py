@@ -25,6 +25,7 @@ from fastapi.responses import JSONResponse
 
 from api.routes import router
 from api.routes.common import close_providers
+from api.routes.exception import unhandled_exception_handler
 from services.security_service import InternalAuthMiddleware
 from config import Settings, settings
 from database import init_database, init_db, dispose_database
@@ -177,6 +178,7 @@ app = FastAPI(
     lifespan=lifespan,
 )
 
+app.add_exception_handler(Exception, unhandled_exception_handler)
 app.add_middleware(InternalAuthMiddleware)
 app.include_router(router, prefix="/api/v1")
 
@@ -13,12 +13,13 @@ import math
 import sys
 from contextlib import asynccontextmanager
 from dataclasses import dataclass
+from functools import lru_cache
 from types import ModuleType
-from typing import AsyncIterator, Optional
+from typing import Annotated, Any, AsyncIterator, Optional
 
 import yaml
 from fastapi import HTTPException, status
-from pydantic import BaseModel, ConfigDict, Field, ValidationError
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, ValidationError
 
 import config as config_module
 from api.requests import AnalyzeRequest
@@ -258,21 +259,27 @@ def _normalize_constant_overrides(raw: dict[str, object]) -> dict[str, object]:
     return normalized
 
 
+@lru_cache(maxsize=None)
+def _settings_field_adapter(key: str) -> TypeAdapter[object]:
+    # Settings.model_validate would rerun every pydantic-settings env source;
+    # the security validator only covers non-overridable fields.
+    field = Settings.model_fields[key]
+    annotation: Any = Annotated[field.annotation, field]
+    return TypeAdapter(annotation, config=ConfigDict(title=key))
+
+
 def _normalize_settings_overrides(raw: dict[str, object]) -> dict[str, object]:
     unknown = sorted(set(raw) - set(_analysis_settings_defaults()))
     if unknown:
         raise _http_400(f"Unknown analysis config setting override(s): {', '.join(unknown)}")
 
-    baseline = settings.model_dump()
-    baseline.update(raw)
-    try:
-        validated = Settings.model_validate(baseline)
-    except ValidationError as exc:
-        raise _http_400(str(exc)) from exc
-    return {
-        key: _copy_value(getattr(validated, key))
-        for key in raw
-    }
+    validated: dict[str, object] = {}
+    for key, value in raw.items():
+        try:
+            validated[key] = _settings_field_adapter(key).validate_python(value)
+        except ValidationError as exc:
+            raise _http_400(str(exc)) from exc
+    return {key: _copy_value(value) for key, value in validated.items()}
 
 
 class AnalysisConfigService:
@@ -9,11 +9,13 @@ You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2
 
 from __future__ import annotations
 
-from collections.abc import Awaitable, Callable
+from collections.abc import Callable
 from contextvars import ContextVar, Token
 from dataclasses import dataclass
+from functools import lru_cache
 from hmac import compare_digest
 import logging
+import sys
 import threading
 import time
 from typing import Mapping, Optional, TypeVar
@@ -22,8 +24,8 @@ import jwt
 from fastapi import HTTPException, Request, status
 from fastapi.responses import JSONResponse
 from pydantic import BaseModel
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.responses import Response
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from config import ALLOWED_CONTEXT_ALGORITHMS, settings
 
@@ -34,21 +36,25 @@ _jti_seen_cache: dict[str, float] = {}
 ModelT = TypeVar("ModelT", bound=BaseModel)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class InternalContext:
     tenant_id: str
     org_id: str
     user_id: str
     username: str
-    permissions: list[str]
-    group_ids: list[str]
+    permissions: frozenset[str]
+    group_ids: tuple[str, ...]
     role: str
     is_superuser: bool
 
 
 def _context_algorithms() -> list[str]:
-    raw = settings.context_algorithms or "HS256"
-    parsed = [str(v).strip().upper() for v in str(raw).split(",") if str(v).strip()]
+    return list(_parse_context_algorithms(str(settings.context_algorithms or "HS256")))
+
+
+@lru_cache(maxsize=8)
+def _parse_context_algorithms(raw: str) -> tuple[str, ...]:
+    parsed = [v.strip().upper() for v in raw.split(",") if v.strip()]
     algorithms = parsed or ["HS256"]
     invalid = sorted(set(algorithms) - ALLOWED_CONTEXT_ALGORITHMS)
     if invalid:
@@ -59,16 +65,19 @@ def _context_algorithms() -> list[str]:
                 + ",".join(invalid)
             ),
         )
-    return algorithms
+    return tuple(algorithms)
 
 
 def _assert_jti_not_replayed(jti: str) -> None:
-    now = time.monotonic()
     ttl = int(getattr(settings, "context_replay_ttl_seconds", 180) or 180)
     with _jti_seen_lock:
-        stale = [token_id for token_id, ts in _jti_seen_cache.items() if now - ts > ttl]
-        for token_id in stale:
-            _jti_seen_cache.pop(token_id, None)
+        # Entries are inserted under the lock in time order, so expiry only has to trim the oldest end.
+        now = time.monotonic()
+        while _jti_seen_cache:
+            oldest, seen_at = next(iter(_jti_seen_cache.items()))
+            if now - seen_at <= ttl:
+                break
+            del _jti_seen_cache[oldest]
         if jti in _jti_seen_cache:
             raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Replayed context token")
         _jti_seen_cache[jti] = now
@@ -77,10 +86,10 @@ def _assert_jti_not_replayed(jti: str) -> None:
 def _parse_bearer(auth_header: str | None) -> str:
     if not auth_header:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Missing authorization header")
-    parts = auth_header.split(" ", 1)
-    if len(parts) != 2 or parts[0].lower() != "bearer" or not parts[1].strip():
+    token = auth_header[7:].strip() if auth_header[:7].lower() == "bearer " else ""
+    if not token:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid authorization header")
-    return parts[1].strip()
+    return token
 
 
 def _string_list(value: object) -> list[str]:
@@ -140,14 +149,15 @@ def _build_context(payload: Mapping[str, object]) -> InternalContext:
     tenant_id = str(payload.get("tenant_id", "")).strip()
     if not tenant_id:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Missing tenant context")
+    # Tenant, org and role come from a small set of values and key per-tenant caches downstream.
     return InternalContext(
-        tenant_id=tenant_id,
-        org_id=str(payload.get("org_id", tenant_id)),
+        tenant_id=sys.intern(tenant_id),
+        org_id=sys.intern(str(payload.get("org_id", tenant_id))),
         user_id=str(payload.get("user_id", "")),
         username=str(payload.get("username", "")),
-        permissions=_string_list(payload.get("permissions")),
-        group_ids=_string_list(payload.get("group_ids")),
-        role=str(payload.get("role", "user")),
+        permissions=frozenset(_string_list(payload.get("permissions"))),
+        group_ids=tuple(_string_list(payload.get("group_ids"))),
+        role=sys.intern(str(payload.get("role", "user"))),
         is_superuser=bool(payload.get("is_superuser", False)),
     )
 
@@ -179,7 +189,7 @@ def ensure_permission(permission: str) -> InternalContext:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Missing internal context")
     if ctx.is_superuser:
         return ctx
-    if permission not in (ctx.permissions or []):
+    if permission not in ctx.permissions:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=f"Missing permission: {permission}")
     return ctx
 
@@ -192,10 +202,18 @@ def require_permission_dependency(permission: str) -> Callable[[], InternalConte
 
 
 def enforce_request_tenant(model: ModelT) -> ModelT:
-    tenant = get_context_tenant(getattr(model, "tenant_id", None))
+    requested = getattr(model, "tenant_id", None)
+    tenant = get_context_tenant(requested)
+    if requested == tenant:
+        return model
     return model.model_copy(update={"tenant_id": tenant})
 
 
+@lru_cache(maxsize=4)
+def _expected_service_token_bytes(token: str) -> bytes:
+    return token.encode()
+
+
 def authenticate_internal_request(request: Request) -> InternalContext:
     return authenticate_internal_headers(request.headers)
 
@@ -205,8 +223,9 @@ def authenticate_internal_headers(headers: Mapping[str, str]) -> InternalContext
     if not expected_service_token:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Missing expected service token")
 
-    provided_service_token = headers.get("x-service-token", "")
-    if not compare_digest(provided_service_token, expected_service_token):
+    # Compare as bytes: str inputs must be ASCII, and a non-ASCII header would otherwise raise.
+    provided_service_token = headers.get("x-service-token", "").encode()
+    if not compare_digest(provided_service_token, _expected_service_token_bytes(expected_service_token)):
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid service token")
 
     bearer = _parse_bearer(headers.get("authorization"))
@@ -214,28 +233,43 @@ def authenticate_internal_headers(headers: Mapping[str, str]) -> InternalContext
     return _build_context(payload)
 
 
+_INTERNAL_PATH_PREFIX = "/api/v1"
+_PUBLIC_INTERNAL_PATHS = frozenset({"/api/v1/ready"})
+
+
 def _requires_internal_auth(path: str) -> bool:
-    return path.startswith("/api/v1") and path != "/api/v1/ready"
+    return path.startswith(_INTERNAL_PATH_PREFIX) and path not in _PUBLIC_INTERNAL_PATHS
+
+
+@lru_cache(maxsize=64)
+def _auth_error_body(detail: str) -> bytes:
+    return bytes(JSONResponse({"detail": detail}).body)
 
 
-class InternalAuthMiddleware(BaseHTTPMiddleware):
-    async def dispatch(
-        self,
-        request: Request,
-        call_next: Callable[[Request], Awaitable[Response]],
-    ) -> Response:
-        path = str(request.url.path or "")
-        if not _requires_internal_auth(path):
-            return await call_next(request)
+class InternalAuthMiddleware:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not _requires_internal_auth(scope["path"]):
+            await self.app(scope, receive, send)
+            return
 
         try:
-            ctx = authenticate_internal_headers(request.headers)
+            ctx = authenticate_internal_headers(Headers(scope=scope))
         except HTTPException as exc:
-            return JSONResponse(status_code=exc.status_code, content={"detail": exc.detail})
-
+            body = _auth_error_body(str(exc.detail))
+            await send({
+                "type": "http.response.start",
+                "status": exc.status_code,
+                "headers": [(b"content-length", str(len(body)).encode()), (b"content-type", b"application/json")],
+            })
+            await send({"type": "http.response.body", "body": body})
+            return
+
+        scope.setdefault("state", {})["internal_context"] = ctx
         token = set_internal_context(ctx)
-        request.state.internal_context = ctx
         try:
-            return await call_next(request)
+            await self.app(scope, receive, send)
         finally:
             reset_internal_context(token)
@@ -16,7 +16,7 @@ from importlib import import_module
 import logging
 import time
 from types import ModuleType
-from typing import AsyncIterator, Optional, Protocol, cast
+from typing import AsyncIterator, Optional, Protocol, Sequence, cast
 
 RedisError: type[Exception] = OSError
 _redis_exceptions_module: ModuleType | None
@@ -33,7 +33,7 @@ log = logging.getLogger(__name__)
 
 
 class RedisPipelineProtocol(Protocol):
-    def rpush(self, key: str, value: str) -> object: ...
+    def rpush(self, key: str, *values: str) -> object: ...
     def ltrim(self, key: str, start: int, end: int) -> object: ...
     def expire(self, key: str, ttl: int) -> object: ...
     async def execute(self) -> object: ...
@@ -144,16 +144,27 @@ async def redis_delete(key: str) -> None:
 
 
 async def redis_rpush(key: str, value: str, ttl: Optional[int] = None, max_len: Optional[int] = None) -> None:
+    await redis_rpush_many(key, [value], ttl=ttl, max_len=max_len)
+
+
+async def redis_rpush_many(
+    key: str,
+    values: Sequence[str],
+    ttl: Optional[int] = None,
+    max_len: Optional[int] = None,
+) -> None:
+    if not values:
+        return
     client = await get_redis()
     if client is None:
         lst = _fallback_lists.setdefault(key, [])
-        lst.append(value)
+        lst.extend(values)
         if max_len and len(lst) > max_len:
             del lst[:-max_len]
         return
     try:
         pipe = client.pipeline()
-        pipe.rpush(key, value)
+        pipe.rpush(key, *values)
         if max_len:
             pipe.ltrim(key, -max_len, -1)
         if ttl:
@@ -162,7 +173,7 @@ async def redis_rpush(key: str, value: str, ttl: Optional[int] = None, max_len:
     except (RedisError, asyncio.TimeoutError, OSError) as exc:
         log.debug("Redis RPUSH error %s: %s", key, exc)
         lst = _fallback_lists.setdefault(key, [])
-        lst.append(value)
+        lst.extend(values)
         if max_len and len(lst) > max_len:
             del lst[:-max_len]
 
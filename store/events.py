@@ -13,10 +13,10 @@ from __future__ import annotations
 import json
 import logging
 from json import JSONDecodeError
-from typing import List, TypedDict
+from typing import List, Sequence, TypedDict
 
 from engine.events.models import DeploymentEvent
-from store.client import redis_lrange, redis_rpush, redis_delete
+from store.client import redis_lrange, redis_rpush, redis_rpush_many, redis_delete
 from config import EVENTS_TTL
 from store import keys
 
@@ -104,5 +104,16 @@ async def append(tenant_id: str, event: DeploymentEvent) -> None:
     except (TypeError, ValueError) as exc:
         log.debug("Events append failed %s: %s", tenant_id, exc)
 
+async def append_many(tenant_id: str, events: Sequence[DeploymentEvent]) -> None:
+    try:
+        await redis_rpush_many(
+            keys.events(tenant_id),
+            [_serialise(event) for event in events],
+            ttl=EVENTS_TTL,
+            max_len=_MAX_EVENTS,
+        )
+    except (TypeError, ValueError) as exc:
+        log.debug("Events append failed %s: %s", tenant_id, exc)
+
 async def clear(tenant_id: str) -> None:
     await redis_delete(keys.events(tenant_id))
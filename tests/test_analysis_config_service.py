@@ -246,4 +246,22 @@ settings:
 def test_get_provider_delegates_to_route_helper(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setattr("api.routes.common.get_provider", lambda tenant_id: {"tenant_id": tenant_id})
 
-    assert analyze_service.get_provider("tenant-a") == {"tenant_id": "tenant-a"}
\ No newline at end of file
+    assert analyze_service.get_provider("tenant-a") == {"tenant_id": "tenant-a"}
+
+
+def test_prepare_request_validates_setting_overrides_per_field() -> None:
+    req = AnalyzeRequest(
+        tenant_id="tenant-a",
+        start=1,
+        end=2,
+        config_yaml="version: 1\nsettings:\n  mad_threshold: '6.5'\n  burst_ratio_thresholds: [[3, high]]\n",
+    )
+
+    prepared = analysis_config_service.prepare_request(req)
+
+    assert prepared.settings_overrides["mad_threshold"] == 6.5
+    assert prepared.settings_overrides["burst_ratio_thresholds"] == [(3.0, "high")]
+
+    bad = AnalyzeRequest(tenant_id="tenant-a", start=1, end=2, config_yaml="version: 1\nsettings:\n  mad_threshold: high\n")
+    with pytest.raises(HTTPException, match="mad_threshold"):
+        analysis_config_service.prepare_request(bad)
@@ -279,6 +279,12 @@ def test_build_log_query_services_use_service_name_label():
     assert query == '{service_name=~"payments"}'
 
 
+def test_build_log_query_escapes_services_and_normalizes_requested_query():
+    assert _build_log_query(["api.gw", "", "checkout"], None) == '{service_name=~"api\\.gw|checkout"}'
+    assert _build_log_query(["", ""], None) == '{service_name=~".+"}'
+    assert _build_log_query(["payments"], ' {job=~".*"} ') == '{job=~".+"}'
+
+
 def test_filter_log_bursts_for_precision_rca_suppresses_periodic_low_signal(monkeypatch):
     monkeypatch.setattr("config.settings.quality_gating_profile", "precision_strict_v1")
     bursts = [
@@ -19,6 +19,7 @@ from engine.anomaly.detection import (
     _severity,
     _compress_runs,
     detect,
+    detect_batch,
 )
 from engine.enums import ChangeType, Severity
 
@@ -84,12 +85,13 @@ def test_detect_filters_non_finite_points():
 
 def test_detect_requires_statistical_or_multisignal_corroboration_for_iso(monkeypatch):
     class FakeIsolationForest:
+        offset_ = -0.5
+
         def __init__(self, *args, **kwargs):
             pass
 
-        def fit_predict(self, x):
-            import numpy as np
-            return np.full(shape=(x.shape[0],), fill_value=-1, dtype=int)
+        def fit(self, x):
+            return self
 
         def score_samples(self, x):
             import numpy as np
@@ -122,3 +124,20 @@ def test_density_cap_limits_anomalies_per_hour(monkeypatch):
     # 0..3000 seconds ~= 0.83h -> cap should keep only one anomaly.
     kept = _apply_density_cap(anomalies, np.array([a.timestamp for a in anomalies], dtype=float))
     assert len(kept) == 1
+
+
+def test_detect_batch_matches_per_series_detect():
+    rng = np.random.default_rng(7)
+    vals_a = list(rng.normal(10.0, 1.0, 60))
+    vals_a[30] = 40.0
+    vals_b = list(rng.normal(5.0, 0.5, 60))
+    vals_b[45] = -20.0
+    ts = [float(i) for i in range(60)]
+
+    def response(name, vals):
+        return {"data": {"result": [{"metric": {"__name__": name}, "values": [[t, str(v)] for t, v in zip(ts, vals)]}]}}
+
+    batched = detect_batch([("a", response("a", vals_a)), ("b", response("b", vals_b))])
+    expected = detect("a", ts, vals_a) + detect("b", ts, vals_b)
+    assert batched
+    assert [item.model_dump() for item in batched] == [item.model_dump() for item in expected]
@@ -81,3 +81,11 @@ def test_iter_series_includes_process_labels_when_present():
     assert rows
     name = rows[0][0]
     assert "process_executable_name=redis-server" in name
+
+
+def test_iter_series_interns_metric_labels_across_responses():
+    metric = {"__name__": "http_requests_total", "service": "api"}
+    first = list(iter_series(_resp(dict(metric), [[1, "1"], [2, "2"]])))
+    second = list(iter_series(_resp(dict(metric), [[1, "3"], [2, "4"]])))
+    assert first[0][0] == 'http_requests_total{service=api}'
+    assert first[0][0] is second[0][0]
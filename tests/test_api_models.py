@@ -11,7 +11,7 @@ You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2
 import pytest
 
 from api.requests import AnalyzeRequest, CorrelateRequest, DeploymentEventRequest, SloRequest
-from pydantic import ValidationError
+from pydantic import BaseModel, ValidationError
 
 
 def test_deployment_request_requires_tenant():
@@ -28,3 +28,61 @@ def test_time_range_validations():
         CorrelateRequest(tenant_id="t1", start=11, end=10)
     with pytest.raises(ValidationError):
         SloRequest(tenant_id="t1", service="svc", start=5, end=5)
+
+
+def test_exported_models_build_schemas_at_import():
+    import api.requests as requests_pkg
+    import api.responses as responses_pkg
+
+    models = [getattr(requests_pkg, name) for name in requests_pkg.__all__]
+    models += [getattr(responses_pkg, name) for name in responses_pkg.__all__]
+    for model in models:
+        if isinstance(model, type) and issubclass(model, BaseModel):
+            assert model.__pydantic_complete__, model.__name__
+            assert not model.model_config.get("defer_build", False), model.__name__
+
+
+def test_analysis_report_keeps_engine_instances_without_revalidation():
+    from api.responses import AnalysisReport, MetricAnomaly
+    from engine.changepoint.cusum import ChangePoint
+    from engine.enums import ChangeType, Severity
+
+    anomaly = MetricAnomaly(
+        metric_name="m", timestamp=1.0, value=2.0, change_type=ChangeType.spike,
+        z_score=3.0, mad_score=1.0, isolation_score=0.0, expected_range=(0.0, 1.0),
+        severity=Severity.high, description="", unknown_field="ignored",
+    )
+    change_point = ChangePoint(0, 1.0, 1.0, 2.0, 1.0, ChangeType.spike)
+    report = AnalysisReport(
+        tenant_id="t1", start=1, end=2, duration_seconds=1,
+        metric_anomalies=[anomaly], log_bursts=[], log_patterns=[], service_latency=[],
+        error_propagation=[], root_causes=[], change_points=[change_point],
+        overall_severity=Severity.low, summary="",
+    )
+    assert report.metric_anomalies[0] is anomaly
+    assert report.change_points[0] is change_point
+    assert not hasattr(anomaly, "unknown_field")
+    report.summary = "done"
+    assert report.summary == "done"
+
+
+def test_analysis_report_coerces_numpy_inside_engine_dataclasses():
+    import json
+
+    import numpy as np
+
+    from api.responses import AnalysisReport
+    from engine.changepoint.cusum import ChangePoint
+    from engine.enums import ChangeType, Severity
+
+    change_point = ChangePoint(1, np.float64(1.5), np.float64(1.0), 2.0, np.float64(0.25), ChangeType.spike)
+    report = AnalysisReport(
+        tenant_id="t1", start=1, end=2, duration_seconds=1,
+        metric_anomalies=[], log_bursts=[], log_patterns=[], service_latency=[],
+        error_propagation=[], root_causes=[], change_points=[change_point],
+        overall_severity=Severity.low, summary="",
+    )
+    dumped = report.model_dump()["change_points"][0]
+    assert type(dumped["timestamp"]) is float
+    assert type(dumped["magnitude"]) is float
+    assert json.loads(report.model_dump_json())["change_points"][0]["timestamp"] == 1.5
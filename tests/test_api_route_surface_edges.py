@@ -13,13 +13,15 @@ import importlib
 import runpy
 import sys
 import types
+from collections import OrderedDict
 
 import numpy as np
+import orjson
 import pytest
 
 from api.requests import ChangepointRequest, CorrelateRequest, LogRequest, MetricRequest
 from api.requests import TraceRequest
-from api.responses.base import NpModel, _coerce
+from api.responses.base import NpModel, NumpyCoerced, _coerce
 from api.routes import correlation as correlation_route
 from api.routes import events as events_route
 from api.routes import forecast as forecast_route
@@ -31,7 +33,7 @@ import main as app_main
 
 
 class DemoModel(NpModel):
-    payload: object
+    payload: NumpyCoerced[object]
 
 
 @pytest.mark.parametrize(
@@ -39,6 +41,10 @@ class DemoModel(NpModel):
     [
         ({"i": np.int64(4), "f": np.float64(1.5), "a": np.array([1, 2])}, {"i": 4, "f": 1.5, "a": [1, 2]}),
         ([np.int64(2), np.float64(3.5), np.array([4, 5])], [2, 3.5, [4, 5]]),
+        (
+            {"rows": [{"z": np.float32(0.5), "n": np.int16(3)}], "nested": OrderedDict(v=np.uint8(7))},
+            {"rows": [{"z": 0.5, "n": 3}], "nested": {"v": 7}},
+        ),
     ],
 )
 def test_np_model_and_coerce_handle_numpy_values(value, expected):
@@ -84,7 +90,7 @@ async def test_metric_trajectory_sorts_and_limits_results(monkeypatch):
         else types.SimpleNamespace(severity="critical"),
     )
 
-    result = await forecast_route.metric_trajectory(req, limit=1)
+    result = orjson.loads((await forecast_route.metric_trajectory(req, limit=1)).body)
 
     assert result == {
         "results": [
@@ -101,6 +107,8 @@ def test_forecast_severity_value_handles_non_dict_payloads():
     assert forecast_route._severity_value("bad") == ""
     assert forecast_route._severity_value({"severity": 4}) == ""
     assert forecast_route._severity_value({"severity": "HIGH"}) == "high"
+    assert forecast_route._row_severity({"forecast": {"severity": "Low"}, "degradation": {"severity": "HIGH"}}) == 3
+    assert forecast_route._row_severity({"forecast": None, "degradation": "bad"}) == 0
 
 
 @pytest.mark.asyncio
@@ -165,17 +173,23 @@ async def test_event_routes_and_json_type_guards(monkeypatch):
     assert json_types.is_json_object(["not", "an", "object"]) is False
 
 
-@pytest.mark.asyncio
-async def test_register_deployment_rejects_blank_tenant(monkeypatch):
-    monkeypatch.setattr(events_route, "enforce_request_tenant", lambda req: req)
-    monkeypatch.setattr(events_route, "get_context_tenant", lambda tenant_id: "  ")
+def test_register_deployment_rejects_blank_tenant(monkeypatch):
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+    from pydantic import ValidationError
 
-    request = importlib.import_module("api.requests").DeploymentEventRequest(
-        tenant_id="tenant-a", service="svc", timestamp=12, version="v1"
-    )
+    DeploymentEventRequest = importlib.import_module("api.requests").DeploymentEventRequest
+    with pytest.raises(ValidationError):
+        DeploymentEventRequest(tenant_id="  ", service="svc", timestamp=12, version="v1")
 
-    with pytest.raises(Exception):
-        await events_route.register_deployment(request)
+    monkeypatch.setattr("services.security_service.ensure_permission", lambda permission: None)
+    app = FastAPI()
+    app.include_router(events_route.router)
+    client = TestClient(app)
+    body = {"tenant_id": "tenant-a", "service": "svc", "timestamp": 12, "version": "v1"}
+
+    assert client.post("/events/deployment", json={**body, "tenant_id": " "}).status_code == 422
+    assert client.post("/events/deployment", params={"tenant_id": "  "}, json=body).status_code == 422
 
 
 @pytest.mark.asyncio
@@ -187,12 +201,8 @@ async def test_log_routes_call_provider_and_analysis(monkeypatch):
             calls.append((query, start, end))
             return {"query": query, "start": start, "end": end}
 
-    async def fake_safe_call(awaitable):
-        return await awaitable
-
     monkeypatch.setattr(logs_route, "enforce_request_tenant", lambda req: req)
     monkeypatch.setattr(logs_route, "get_provider", lambda tenant_id: DummyProvider())
-    monkeypatch.setattr(logs_route, "safe_call", fake_safe_call)
     monkeypatch.setattr(logs_route, "to_nanoseconds", lambda value: value * 10)
     monkeypatch.setattr(logs_route.logs, "analyze", lambda raw: [{"kind": "pattern", **raw}])
     monkeypatch.setattr(logs_route.logs, "detect_bursts", lambda raw: [{"kind": "burst", **raw}])
@@ -217,12 +227,8 @@ async def test_metric_anomalies_and_changepoints_routes_cover_fallbacks(monkeypa
         async def query_metrics(self, query, start, end, step):
             return {"query": query, "start": start, "end": end, "step": step}
 
-    async def fake_safe_call(awaitable):
-        return await awaitable
-
     monkeypatch.setattr(metrics_route, "enforce_request_tenant", lambda req: req)
     monkeypatch.setattr(metrics_route, "get_provider", lambda tenant_id: DummyProvider())
-    monkeypatch.setattr(metrics_route, "safe_call", fake_safe_call)
     monkeypatch.setattr(
         metrics_route.anomaly,
         "iter_series",
@@ -233,15 +239,19 @@ async def test_metric_anomalies_and_changepoints_routes_cover_fallbacks(monkeypa
     )
     monkeypatch.setattr(
         metrics_route.anomaly,
-        "detect",
-        lambda metric, ts, vals, sensitivity: [types.SimpleNamespace(timestamp=3, metric=metric)]
-        if metric == "metric-b"
-        else [types.SimpleNamespace(timestamp=1, metric=metric)],
+        "detect_batch",
+        lambda metrics_raw, sensitivity: [
+            types.SimpleNamespace(timestamp=3, metric="metric-b", sensitivity=sensitivity),
+            types.SimpleNamespace(timestamp=1, metric="metric-a", sensitivity=sensitivity),
+        ]
+        if metrics_raw[0][0] == "up"
+        else [],
     )
 
     req = MetricRequest(tenant_id="tenant-a", query="up", start=1, end=5, step="30s", sensitivity=4.0)
     anomalies = await metrics_route.metric_anomalies(req)
     assert [item.timestamp for item in anomalies] == [1, 3]
+    assert {item.sensitivity for item in anomalies} == {4.0}
 
     captured = []
 
@@ -278,12 +288,16 @@ async def test_correlation_and_trace_routes_cover_remaining_branches(monkeypatch
     monkeypatch.setattr(correlation_route, "get_provider", lambda tenant_id: DummyProvider())
     monkeypatch.setattr(correlation_route, "DEFAULT_METRIC_QUERIES", ["default-metric"])
 
-    async def fake_fetch_metrics(provider, queries, start, end, step):
+    async def fake_fetch_metrics(provider, queries, start, end, step, limiter=None):
+        assert limiter is correlation_route.tenant_query_slots("tenant-a")
         return [("q1", "metric-raw")]
 
     monkeypatch.setattr(correlation_route, "fetch_metrics", fake_fetch_metrics)
-    monkeypatch.setattr(correlation_route.anomaly, "iter_series", lambda resp, query_hint=None: [("cpu", [1], [2.0])])
-    monkeypatch.setattr(correlation_route.anomaly, "detect", lambda metric, ts, vals: [types.SimpleNamespace(name=metric)])
+    monkeypatch.setattr(
+        correlation_route.anomaly,
+        "detect_batch",
+        lambda metrics_raw: [types.SimpleNamespace(name=q) for q, _ in metrics_raw],
+    )
     monkeypatch.setattr(correlation_route.logs, "detect_bursts", lambda raw: [types.SimpleNamespace(stream="api")])
     monkeypatch.setattr(
         correlation_route,
@@ -308,7 +322,7 @@ async def test_correlation_and_trace_routes_cover_remaining_branches(monkeypatch
     )
     monkeypatch.setattr(correlation_route, "get_registry", lambda: DummyRegistry())
 
-    result = await correlation_route.correlate_signals(
+    response = await correlation_route.correlate_signals(
         CorrelateRequest(
             tenant_id="tenant-a",
             start=1,
@@ -319,6 +333,7 @@ async def test_correlation_and_trace_routes_cover_remaining_branches(monkeypatch
             window_seconds=90,
         )
     )
+    result = orjson.loads(response.body)
 
     assert result == {
         "correlated_events": [{
@@ -337,12 +352,8 @@ async def test_correlation_and_trace_routes_cover_remaining_branches(monkeypatch
         }],
     }
 
-    async def fake_safe_call(awaitable):
-        return await awaitable
-
     monkeypatch.setattr(traces_route, "enforce_request_tenant", lambda req: req)
     monkeypatch.setattr(traces_route, "get_provider", lambda tenant_id: DummyProvider())
-    monkeypatch.setattr(traces_route, "safe_call", fake_safe_call)
     monkeypatch.setattr(traces_route.traces, "analyze", lambda raw, threshold: [{"raw": raw, "threshold": threshold}])
 
     traced = await traces_route.trace_anomalies(
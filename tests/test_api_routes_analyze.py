@@ -114,3 +114,11 @@ async def test_analyze_config_template_route(monkeypatch):
     assert response.version == 1
     assert response.defaults["request"]["step"] == "15s"
     assert response.file_name == "becertain-rca-defaults.yaml"
+
+
+def test_analyze_route_uses_pydantic_json_serialization():
+    from fastapi.datastructures import DefaultPlaceholder
+
+    route = next(r for r in analyze_route.router.routes if getattr(r, "path", None) == "/analyze")
+    assert route.response_model is AnalysisReport
+    assert isinstance(route.response_class, DefaultPlaceholder)
@@ -8,12 +8,13 @@ you may not use this file except in compliance with the License.
 You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
 """
 
-from types import SimpleNamespace
-
+import orjson
 import pytest
 
 from api.routes import causal as causal_route
+from api.routes import common as route_common
 from api.requests import CorrelateRequest
+from engine.causal.granger import GrangerResult
 
 
 class DummyProvider:
@@ -34,7 +35,7 @@ class DummyProvider:
 async def test_granger_causality_uses_unique_series_keys(monkeypatch):
     dummy = DummyProvider()
     monkeypatch.setattr(causal_route, "get_provider", lambda tid: dummy)
-    monkeypatch.setattr(causal_route, "DEFAULT_METRIC_QUERIES", [])
+    monkeypatch.setattr(route_common, "DEFAULT_METRIC_QUERIES", [])
 
     captured = {"count": 0, "keys": []}
 
@@ -57,7 +58,7 @@ async def test_granger_causality_uses_unique_series_keys(monkeypatch):
         metric_queries=["q1", "q2"],
     )
 
-    res = await causal_route.granger_causality(req)
+    res = orjson.loads((await causal_route.granger_causality(req)).body)
     assert res["fresh_pairs"] == 0
     assert captured["count"] == 2
     assert captured["keys"][0] != captured["keys"][1]
@@ -68,16 +69,14 @@ async def test_granger_causality_uses_unique_series_keys(monkeypatch):
 async def test_granger_causality_include_raw_pairs(monkeypatch):
     dummy = DummyProvider()
     monkeypatch.setattr(causal_route, "get_provider", lambda tid: dummy)
-    monkeypatch.setattr(causal_route, "DEFAULT_METRIC_QUERIES", [])
+    monkeypatch.setattr(route_common, "DEFAULT_METRIC_QUERIES", [])
 
     calls = {"count": 0}
 
     def fake_test_all_pairs(series_map, max_lag=None, p_threshold=None):
         calls["count"] += 1
-        if calls["count"] == 1:
-            return []
         return [
-            SimpleNamespace(
+            GrangerResult(
                 cause_metric="q1::shared_metric",
                 effect_metric="q2::shared_metric",
                 max_lag=2,
@@ -102,7 +101,9 @@ async def test_granger_causality_include_raw_pairs(monkeypatch):
         metric_queries=["q1", "q2"],
     )
 
-    res = await causal_route.granger_causality(req, include_raw=True)
+    res = orjson.loads((await causal_route.granger_causality(req, include_raw=True)).body)
+    assert calls["count"] == 1
+    assert res["fresh_pairs"] == 1
     assert res["raw_causal_pairs"] == [
         {
             "cause_metric": "q1::shared_metric",
@@ -114,3 +115,21 @@ async def test_granger_causality_include_raw_pairs(monkeypatch):
             "strength": 0.8,
         }
     ]
+
+
+def test_select_top_variance_series_filters_and_keeps_input_order():
+    flat = [5.0] * 20
+    short = [1.0, 9.0] * 5
+    low = [float(i % 2) for i in range(20)]
+    high = [float(i % 2) * 10 for i in range(20)]
+    tied = list(high)
+    noisy = [float("nan"), float("inf")] + [float(i % 3) for i in range(14)]
+    series_map = {"flat": flat, "high": high, "short": short, "low": low, "tied": tied, "noisy": noisy}
+
+    selected = causal_route._select_top_variance_series(series_map, max_series=2)
+    assert list(selected) == ["high", "tied"]
+    assert selected["high"] is high
+
+    selected = causal_route._select_top_variance_series(series_map, max_series=10)
+    assert list(selected) == ["high", "low", "tied", "noisy"]
+    assert causal_route._select_top_variance_series({}, max_series=3) == {}
@@ -6,6 +6,7 @@ you may not use this file except in compliance with the License.
 You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
 """
 
+import orjson
 import pytest
 
 from api.routes import correlation as corr_route
@@ -56,9 +57,32 @@ async def test_correlate_route_uses_weights(monkeypatch):
         window_seconds=30,
     )
 
-    result = await corr_route.correlate_signals(req)
+    result = orjson.loads((await corr_route.correlate_signals(req)).body)
     # With no anomalies/logs there's nothing to correlate,
     # but route should still compute and return lists.
     assert "correlated_events" in result
     assert isinstance(result["correlated_events"], list)
     assert "log_metric_links" in result
+
+
+@pytest.mark.asyncio
+async def test_correlate_route_keeps_partial_results_when_a_source_fails(monkeypatch):
+    class FailingLogsProvider:
+        async def query_logs(self, query, start, end):
+            raise RuntimeError("loki down")
+
+    detected = []
+
+    async def fake_fetch_metrics(*args, **kwargs):
+        return [("q", {"data": {"result": []}})]
+
+    monkeypatch.setattr(corr_route, "get_registry", lambda: DummyRegistry())
+    monkeypatch.setattr(corr_route, "get_provider", lambda tid: FailingLogsProvider())
+    monkeypatch.setattr(corr_route, "fetch_metrics", fake_fetch_metrics)
+    monkeypatch.setattr(corr_route.logs, "detect_bursts", lambda raw: detected.append(raw) or [])
+
+    req = CorrelateRequest(tenant_id="t1", start=0, end=10, step="1", window_seconds=30)
+    result = orjson.loads((await corr_route.correlate_signals(req)).body)
+
+    assert result == {"correlated_events": [], "log_metric_links": []}
+    assert detected == []
@@ -54,3 +54,33 @@ async def test_changepoints_route_uses_threshold_sigma_explicitly(monkeypatch):
 
     assert rows == []
     assert captured["threshold_sigma"] == 7.0
+
+
+@pytest.mark.asyncio
+async def test_metric_detection_runs_off_the_event_loop_thread(monkeypatch):
+    import threading
+
+    from api.requests import MetricRequest
+
+    loop_thread = threading.get_ident()
+    seen = []
+
+    def fake_detect_batch(metrics_raw, sensitivity):
+        seen.append(threading.get_ident())
+        return []
+
+    def fake_detect(ts, vals, threshold_sigma=None, metric_name="metric"):
+        seen.append(threading.get_ident())
+        return []
+
+    monkeypatch.setattr(metrics_route, "get_provider", lambda tenant_id: DummyProvider())
+    monkeypatch.setattr(metrics_route.anomaly, "detect_batch", fake_detect_batch)
+    monkeypatch.setattr(metrics_route, "changepoint_detect", fake_detect)
+
+    await metrics_route.metric_anomalies(MetricRequest(tenant_id="t1", query="up", start=1, end=5, step="15s"))
+    await metrics_route.metric_changepoints(
+        ChangepointRequest(tenant_id="t1", query="up", start=1, end=5, step="15s", threshold_sigma=3.0)
+    )
+
+    assert len(seen) == 2
+    assert loop_thread not in seen
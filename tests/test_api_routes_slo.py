@@ -8,13 +8,14 @@ you may not use this file except in compliance with the License.
 You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
 """
 
-from types import SimpleNamespace
-
+import orjson
 import pytest
 
 from api.routes import slo as slo_route
 from api.requests import SloRequest
 from config import settings
+from engine.enums import Severity
+from engine.slo import BudgetStatus, SloBurnAlert
 
 
 class DummyProvider:
@@ -69,6 +70,22 @@ async def test_slo_burn_custom_queries_override(monkeypatch):
     assert dummy.queries == ["errQ", "totQ"]
 
 
+@pytest.mark.asyncio
+async def test_slo_burn_default_queries_follow_template_override(monkeypatch):
+    dummy = DummyProvider()
+    monkeypatch.setattr(slo_route, "get_provider", lambda tid: dummy)
+    monkeypatch.setattr(slo_route, "slo_evaluate", dummy_slo_evaluate)
+    monkeypatch.setattr(slo_route, "remaining_minutes", dummy_remaining)
+
+    req = SloRequest(tenant_id="t1", service="abc", start=0, end=1, step="1", target_availability=0.99)
+    await slo_route.slo_burn(req)
+    monkeypatch.setattr(slo_route.settings, "slo_error_query_template", "errors{{svc='{service}'}}")
+    monkeypatch.setattr(slo_route.settings, "slo_total_query_template", "totals{{svc='{service}'}}")
+    await slo_route.slo_burn(req)
+
+    assert dummy.queries[2:] == ["errors{svc='abc'}", "totals{svc='abc'}"]
+
+
 @pytest.mark.asyncio
 async def test_slo_burn_handles_mismatched_series_lengths(monkeypatch):
     class MismatchProvider:
@@ -104,7 +121,7 @@ async def test_slo_burn_handles_mismatched_series_lengths(monkeypatch):
 
     req = SloRequest(tenant_id="t1", service="abc", start=0, end=10, step="1", target_availability=0.99)
     res = await slo_route.slo_burn(req)
-    assert "burn_alerts" in res
+    assert "burn_alerts" in orjson.loads(res.body)
     assert seen["calls"] == 1
 
 
@@ -120,18 +137,84 @@ async def test_slo_burn_serializes_budget_status(monkeypatch):
     monkeypatch.setattr(
         slo_route,
         "slo_evaluate",
-        lambda service, err_vals, tot_vals, ts, target: [SimpleNamespace(name="fast-burn")],
+        lambda service, err_vals, tot_vals, ts, target: [
+            SloBurnAlert("abc", "1h", 0.05, 5.0, 12.5, Severity.high),
+        ],
     )
     monkeypatch.setattr(
         slo_route,
         "remaining_minutes",
-        lambda service, err_vals, tot_vals, target: SimpleNamespace(remaining=42, status="healthy"),
+        lambda service, err_vals, tot_vals, target: BudgetStatus("abc", 0.99, 0.995, 50.0, 42.0, True),
     )
 
     req = SloRequest(tenant_id="t1", service="abc", start=0, end=1, step="1", target_availability=0.99)
     res = await slo_route.slo_burn(req)
 
-    assert res == {
-        "burn_alerts": [{"name": "fast-burn"}],
-        "budget_status": {"remaining": 42, "status": "healthy"},
+    assert orjson.loads(res.body) == {
+        "burn_alerts": [
+            {
+                "service": "abc",
+                "window_label": "1h",
+                "error_rate": 0.05,
+                "burn_rate": 5.0,
+                "budget_consumed_pct": 12.5,
+                "severity": "high",
+            }
+        ],
+        "budget_status": {
+            "service": "abc",
+            "target_availability": 0.99,
+            "current_availability": 0.995,
+            "budget_used_pct": 50.0,
+            "remaining_minutes": 42.0,
+            "on_track": True,
+        },
     }
+
+
+@pytest.mark.asyncio
+async def test_slo_burn_queries_error_and_total_concurrently(monkeypatch):
+    import asyncio
+
+    in_flight = []
+    both_started = asyncio.Event()
+
+    class ConcurrentProvider:
+        async def query_metrics(self, query, start, end, step):
+            in_flight.append(query)
+            if len(in_flight) == 2:
+                both_started.set()
+            await asyncio.wait_for(both_started.wait(), timeout=1)
+            return {"data": {"result": []}}
+
+    monkeypatch.setattr(slo_route, "get_provider", lambda tid: ConcurrentProvider())
+
+    req = SloRequest(tenant_id="t1", service="abc", start=0, end=1, step="1", error_query="err", total_query="tot")
+    result = await slo_route.slo_burn(req)
+
+    assert in_flight == ["err", "tot"]
+    assert orjson.loads(result.body) == {"burn_alerts": [], "budget_status": None}
+
+
+@pytest.mark.asyncio
+async def test_slo_burn_computes_budget_once_for_last_pair(monkeypatch):
+    dummy = DummyProvider()
+    monkeypatch.setattr(slo_route, "get_provider", lambda tid: dummy)
+    monkeypatch.setattr(
+        slo_route.anomaly,
+        "iter_series",
+        lambda raw, query_hint=None: [("a", [1, 2], [1.0, 1.0]), ("b", [1, 2], [2.0, 2.0])],
+    )
+    monkeypatch.setattr(slo_route, "slo_evaluate", dummy_slo_evaluate)
+    calls = []
+
+    def tracking_remaining(service, err_vals, tot_vals, target):
+        calls.append((err_vals, tot_vals))
+        return None
+
+    monkeypatch.setattr(slo_route, "remaining_minutes", tracking_remaining)
+
+    req = SloRequest(tenant_id="t1", service="abc", start=0, end=1, step="1", target_availability=0.99)
+    await slo_route.slo_burn(req)
+
+    assert calls == [([2.0, 2.0], [2.0, 2.0])]
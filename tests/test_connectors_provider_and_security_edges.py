@@ -8,10 +8,12 @@ You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2
 
 from __future__ import annotations
 
+import sys
 from types import SimpleNamespace
 
 import httpx
 import jwt
+import orjson
 import pytest
 from fastapi import HTTPException
 from pydantic import BaseModel
@@ -40,6 +42,10 @@ class _Response:
     def json(self):
         return self._payload
 
+    @property
+    def content(self):
+        return orjson.dumps(self._payload)
+
     def raise_for_status(self):
         if self.status_code >= 400:
             request = httpx.Request("GET", "https://example")
@@ -72,6 +78,7 @@ async def test_datasource_helpers_and_provider(monkeypatch):
     connector.health_path = "/health"
     assert connector.health_url == "https://example/health"
     assert connector._headers() == {"A": "b", "X-Scope-OrgID": "tenant"}
+    assert connector._headers() is connector._headers()
     await connector.aclose()
     assert connector.client.is_closed is True
 
@@ -213,6 +220,8 @@ def test_security_service_remaining_edges(monkeypatch):
         security_service._build_context({})
     ctx = security_service._build_context({"tenant_id": "tenant", "org_id": "org", "user_id": "u1", "username": "alice", "permissions": ["read"], "group_ids": ["g1"], "role": "admin", "is_superuser": True})
     assert ctx.tenant_id == "tenant"
+    assert ctx.permissions == frozenset({"read"})
+    assert ctx.group_ids == ("g1",)
 
     token_var = security_service.set_internal_context(ctx)
     try:
@@ -261,4 +270,36 @@ def test_security_service_remaining_edges(monkeypatch):
     security_service.settings.expected_service_token = "internal-service-token"
     assert security_service._requires_internal_auth("/api/v1/query") is True
     assert security_service._requires_internal_auth("/api/v1/ready") is False
-    assert security_service._requires_internal_auth("/health") is False
\ No newline at end of file
+    assert security_service._requires_internal_auth("/health") is False
+
+
+def test_jti_replay_cache_trims_only_expired_prefix(monkeypatch):
+    _set_security_defaults()
+    now = 1000.0
+    monkeypatch.setattr(security_service.time, "monotonic", lambda: now)
+    with security_service._jti_seen_lock:
+        security_service._jti_seen_cache.update({"a": 700.0, "b": 830.0, "c": 900.0})
+
+    security_service._assert_jti_not_replayed("d")
+
+    assert list(security_service._jti_seen_cache) == ["b", "c", "d"]
+    with pytest.raises(HTTPException):
+        security_service._assert_jti_not_replayed("b")
+
+
+@pytest.mark.parametrize("header", ["Bearer", "Bearer    ", "Bearerabc", " Bearer abc", "Basic abc"])
+def test_parse_bearer_rejects_malformed_headers(header):
+    with pytest.raises(HTTPException):
+        security_service._parse_bearer(header)
+
+
+def test_parse_bearer_is_case_insensitive_and_strips_token():
+    assert security_service._parse_bearer("bEaReR   tok ") == "tok"
+
+
+def test_build_context_interns_low_cardinality_fields():
+    tenant = "".join(["ten", "ant-x"])
+    ctx = security_service._build_context({"tenant_id": tenant, "role": "".join(["ad", "min"])})
+    assert ctx.tenant_id is sys.intern("tenant-x")
+    assert ctx.org_id is ctx.tenant_id
+    assert ctx.role is sys.intern("admin")
@@ -170,3 +170,20 @@ def test_correlate_with_custom_weight_fn():
     assert events
     expected = round(min(settings.correlation_score_max, wfn(m_score, 0, 0)), 3)
     assert events[0].confidence == expected
+
+
+def test_correlate_keeps_input_order_within_window():
+    anomalies = [make_anomaly(30), make_anomaly(10), make_anomaly(500), make_anomaly(20)]
+    bursts = [make_logburst(400, 450), make_logburst(15, 25)]
+    events = sorted(correlate(anomalies, bursts, [], window_seconds=60), key=lambda e: e.window_start)
+    assert len(events) == 2
+    assert [a.timestamp for a in events[0].metric_anomalies] == [30, 10, 20]
+    assert events[0].log_bursts == [bursts[1]]
+    assert events[1].log_bursts == [bursts[0]]
+
+
+def test_correlate_skips_anchors_covered_by_previous_window():
+    anomalies = [make_anomaly(0), make_anomaly(50), make_anomaly(100), make_anomaly(101)]
+    events = sorted(correlate(anomalies, [], [], window_seconds=60), key=lambda e: e.window_start)
+    assert [(e.window_start, e.window_end) for e in events] == [(-60, 60), (40, 160)]
+    assert [a.timestamp for a in events[1].metric_anomalies] == [50, 100, 101]
@@ -19,6 +19,20 @@ def test_bayesian_score_consistency():
     assert results[0].category.name == "deployment"
 
 
+def test_bayesian_score_cache_follows_setting_overrides(monkeypatch):
+    from engine.causal import bayesian
+
+    first = bayesian_score(False, True, False, False, False)
+    second = bayesian_score(False, True, False, False, False)
+    assert first == second
+    assert first is not second
+
+    monkeypatch.setattr(bayesian.settings, "bayesian_priors", {"unknown": 0.9, "deployment": 0.1})
+    overridden = bayesian_score(False, True, False, False, False)
+    assert {r.category.value for r in overridden} == {"unknown", "deployment"}
+    assert overridden != first
+
+
 def test_causal_graph_basic():
     g = CausalGraph()
     g.add_edge("a", "b", 0.5)
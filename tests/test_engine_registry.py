@@ -90,3 +90,43 @@ async def test_engine_registry_sanitizes_corrupt_stored_weights(monkeypatch):
     assert all(v >= 0.0 for v in weights.values())
     assert abs(sum(weights.values()) - 1.0) < 1e-6
     assert state.update_count == 0
+
+
+@pytest.mark.asyncio
+async def test_engine_registry_coalesces_concurrent_event_writes(monkeypatch):
+    import asyncio
+
+    from engine.events.models import DeploymentEvent
+    from store import events as estore
+
+    batches = []
+    release = asyncio.Event()
+
+    async def fake_append_many(tenant_id, events):
+        batches.append((tenant_id, [event.version for event in events]))
+        if len(batches) == 1:
+            await release.wait()
+
+    monkeypatch.setattr(estore, "append_many", fake_append_many)
+    reg = ereg.TenantRegistry()
+
+    def event(version):
+        return DeploymentEvent(service="svc", timestamp=1.0, version=version)
+
+    first = asyncio.create_task(reg.register_event("t", event("v0")))
+    await asyncio.sleep(0)
+    rest = [asyncio.create_task(reg.register_event("t", event(f"v{i}"))) for i in range(1, 4)]
+    await asyncio.sleep(0)
+    assert not first.done()
+    release.set()
+    await asyncio.gather(first, *rest)
+
+    assert batches == [("t", ["v0"]), ("t", ["v1", "v2", "v3"])]
+    assert reg._event_flushes == {}
+
+    async def failing_append_many(tenant_id, events):
+        raise RuntimeError("store down")
+
+    monkeypatch.setattr(estore, "append_many", failing_append_many)
+    with pytest.raises(RuntimeError, match="store down"):
+        await reg.register_event("t", event("v4"))
@@ -10,6 +10,7 @@ You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2
 
 import pytest
 import httpx
+import orjson
 
 from datasources.helpers import fetch_json, fetch_text
 from datasources.exceptions import InvalidQuery, QueryTimeout
@@ -28,6 +29,10 @@ class DummyResponse:
     def json(self):
         return self._json
 
+    @property
+    def content(self):
+        return orjson.dumps(self._json)
+
 
 class DummyClient:
     def __init__(self, resp: DummyResponse):
@@ -73,3 +78,12 @@ async def test_fetch_text_success(monkeypatch):
     monkeypatch.setattr(httpx, "AsyncClient", lambda timeout: DummyClient(resp))
     got = await fetch_text("url")
     assert got == "hello"
+
+
+@pytest.mark.asyncio
+async def test_fetch_json_decodes_raw_response_body():
+    body = b'{"status":"success","data":{"result":[{"metric":{},"values":[[1,"NaN"]]}]}}'
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, content=body))
+    async with httpx.AsyncClient(transport=transport) as client:
+        got = await fetch_json("https://mimir/api/v1/query_range", client=client)
+    assert got["data"]["result"][0]["values"] == [[1, "NaN"]]
@@ -11,6 +11,7 @@ You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2
 import asyncio
 import json
 import uuid
+from fastapi import HTTPException
 from pydantic import BaseModel
 import jwt
 from starlette.responses import JSONResponse
@@ -133,8 +134,8 @@ def test_enforce_request_tenant_overrides_payload():
             org_id="ctx-tenant",
             user_id="u1",
             username="alice",
-            permissions=[],
-            group_ids=[],
+            permissions=frozenset(),
+            group_ids=(),
             role="user",
             is_superuser=False,
         )
@@ -149,6 +150,8 @@ def test_enforce_request_tenant_overrides_payload():
         req = Req(tenant_id="spoofed", start=1, end=2)
         scoped = enforce_request_tenant(req)
         assert scoped.tenant_id == "ctx-tenant"
+        assert req.tenant_id == "spoofed"
+        assert enforce_request_tenant(scoped) is scoped
     finally:
         reset_internal_context(token)
 
@@ -194,3 +197,49 @@ def test_context_token_replay_rejected():
     assert status_1 == 200
     assert status_2 == 401
     assert payload_2["detail"] == "Replayed context token"
+
+
+def test_unauthenticated_paths_pass_straight_through():
+    _set_security_defaults()
+    status, payload = asyncio.run(_run_request("/health", headers={}))
+    assert status == 200
+    assert payload["tenant_id"] == "spoofed-tenant"
+
+
+def test_rejections_reuse_encoded_error_bodies():
+    _set_security_defaults()
+    security_service._auth_error_body.cache_clear()
+    for _ in range(2):
+        status, payload = asyncio.run(_run_request("/api/v1/tenant", headers={}))
+        assert status == 401
+        assert payload == {"detail": "Invalid service token"}
+    assert security_service._auth_error_body.cache_info().hits == 1
+
+
+def test_non_ascii_service_token_is_rejected_not_errored():
+    _set_security_defaults()
+    with pytest.raises(HTTPException) as exc:
+        security_service.authenticate_internal_headers({"x-service-token": "töken"})
+    assert exc.value.status_code == 401
+
+
+def test_expected_service_token_change_applies_to_next_request():
+    _set_security_defaults()
+    headers = {"x-service-token": "internal-service-token", "authorization": "Bearer invalid"}
+    with pytest.raises(HTTPException) as exc:
+        security_service.authenticate_internal_headers(headers)
+    assert exc.value.detail != "Invalid service token"
+
+    settings.expected_service_token = "rotated-service-token"
+    try:
+        with pytest.raises(HTTPException) as exc:
+            security_service.authenticate_internal_headers(headers)
+        assert exc.value.status_code == 401
+        assert exc.value.detail == "Invalid service token"
+
+        headers["x-service-token"] = "rotated-service-token"
+        with pytest.raises(HTTPException) as exc:
+            security_service.authenticate_internal_headers(headers)
+        assert exc.value.detail != "Invalid service token"
+    finally:
+        _set_security_defaults()
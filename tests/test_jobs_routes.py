@@ -13,6 +13,7 @@ from types import SimpleNamespace
 
 import pytest
 from fastapi import HTTPException
+from pydantic import ValidationError
 
 from api.requests import AnalyzeJobCreateRequest
 from api.responses import JobStatus
@@ -27,8 +28,8 @@ def _ctx() -> InternalContext:
         org_id="tenant-a",
         user_id="user-1",
         username="alice",
-        permissions=["create:rca", "read:rca", "delete:rca"],
-        group_ids=[],
+        permissions=frozenset({"create:rca", "read:rca", "delete:rca"}),
+        group_ids=(),
         role="user",
         is_superuser=False,
     )
@@ -77,6 +78,12 @@ def test_summary_maps_job_view():
     assert summary.summary_preview == "summary"
 
 
+def test_summary_validates_job_store_rows():
+    row = _job_view().model_copy(update={"status": "not-a-status"})
+    with pytest.raises(ValidationError):
+        jobs_route._summary(row)
+
+
 @pytest.mark.asyncio
 async def test_create_job_route(monkeypatch):
     monkeypatch.setattr(jobs_route, "_require_permission", lambda name: None)
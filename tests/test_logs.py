@@ -9,7 +9,7 @@ You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2
 """
 
 from engine.logs.frequency import detect_bursts
-from engine.logs.patterns import analyze
+from engine.logs.patterns import _normalize, analyze
 from engine.enums import Severity
 
 
@@ -73,3 +73,8 @@ def test_detect_bursts_keeps_severity_for_error_windows():
     bursts = detect_bursts(resp, window_seconds=10)
     assert bursts
     assert any(b.severity.weight() >= Severity.medium.weight() for b in bursts)
+
+
+def test_normalize_masks_hex_and_collapses_whitespace():
+    line = "  ERROR\trequest DEADBEEF42 failed \n\n after  3ms  "
+    assert _normalize(line) == "ERROR request <_> failed after 3ms"
@@ -45,6 +45,45 @@ async def test_get_provider_caches_resolved_tenant(monkeypatch):
     assert set(common._providers) == {"tenant-from-context"}
 
 
+def test_get_provider_reuses_datasource_settings_across_tenants(monkeypatch):
+    common._providers.clear()
+    monkeypatch.setattr(common, "get_context_tenant", lambda tenant_id=None: tenant_id)
+    monkeypatch.setattr(common, "DataSourceProvider", _DummyProvider)
+
+    first = common.get_provider("tenant-a")
+    second = common.get_provider("tenant-b")
+
+    assert first is not second
+    assert first.settings is second.settings is common.datasource_settings()
+    common._providers.clear()
+
+
+@pytest.mark.asyncio
+async def test_get_provider_builds_once_under_concurrent_requests(monkeypatch):
+    import asyncio
+
+    built = []
+
+    class _CountingProvider(_DummyProvider):
+        def __init__(self, tenant_id: str, settings: object):
+            super().__init__(tenant_id, settings)
+            built.append(tenant_id)
+
+    common._providers.clear()
+    monkeypatch.setattr(common, "get_context_tenant", lambda tenant_id=None: tenant_id)
+    monkeypatch.setattr(common, "DataSourceProvider", _CountingProvider)
+
+    async def handler(tenant_id: str) -> object:
+        await asyncio.sleep(0)
+        return common.get_provider(tenant_id)
+
+    providers = await asyncio.gather(*(handler("tenant-a") for _ in range(50)))
+
+    assert built == ["tenant-a"]
+    assert all(provider is providers[0] for provider in providers)
+    common._providers.clear()
+
+
 @pytest.mark.asyncio
 async def test_close_providers_closes_everything(monkeypatch):
     first = _DummyProvider("t1", object())
@@ -59,6 +98,71 @@ async def test_close_providers_closes_everything(monkeypatch):
     assert common._providers == {}
 
 
+@pytest.mark.asyncio
+async def test_close_providers_runs_in_parallel_and_survives_failures():
+    import asyncio
+
+    started = []
+    release = asyncio.Event()
+
+    class _SlowProvider(_DummyProvider):
+        async def aclose(self) -> None:
+            started.append(self.tenant_id)
+            await release.wait()
+            self.closed = True
+
+    class _BrokenProvider(_DummyProvider):
+        async def aclose(self) -> None:
+            raise RuntimeError("close failed")
+
+    slow_a = _SlowProvider("t1", object())
+    slow_b = _SlowProvider("t2", object())
+    common._providers.clear()
+    common._providers.update({"t1": slow_a, "t2": slow_b, "t3": _BrokenProvider("t3", object())})
+
+    closing = asyncio.create_task(common.close_providers())
+    for _ in range(10):
+        await asyncio.sleep(0)
+    assert started == ["t1", "t2"]
+    release.set()
+    await closing
+
+    assert slow_a.closed is True
+    assert slow_b.closed is True
+    assert common._providers == {}
+
+
+@pytest.mark.asyncio
+async def test_tenant_query_slots_cap_concurrent_upstream_calls(monkeypatch):
+    import asyncio
+
+    common._query_slots.clear()
+    monkeypatch.setattr(common, "get_context_tenant", lambda tenant_id=None: tenant_id)
+    monkeypatch.setattr(common.datasource_settings(), "max_concurrent_queries", 2)
+
+    slots = common.tenant_query_slots("tenant-a")
+    assert common.tenant_query_slots("tenant-a") is slots
+    assert common.tenant_query_slots("tenant-b") is not slots
+
+    running = 0
+    peak = 0
+
+    async def query() -> int:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0)
+        running -= 1
+        return 1
+
+    results = await asyncio.gather(*(common.bounded(slots, query()) for _ in range(10)))
+
+    assert results == [1] * 10
+    assert peak == 2
+    await common.close_providers()
+    assert common._query_slots == {}
+
+
 @pytest.mark.asyncio
 async def test_safe_call_success_and_failure():
     async def good() -> str:
@@ -103,4 +207,42 @@ async def test_value_helpers_and_fetch_requested_metrics(monkeypatch):
     assert captured["queries"] == ["custom_q", "builtin_cpu", "builtin_mem"]
     assert captured["start"] == 10
     assert captured["end"] == 20
-    assert captured["step"] == "30s"
\ No newline at end of file
+    assert captured["step"] == "30s"
+    assert common.merge_metric_queries(None, ["a", "b", "a"]) == ["a", "b"]
+    assert common.merge_metric_queries(["b", "c"], ["a", "b"]) == ["b", "c", "a"]
+
+    defaults = ["a", "b"]
+    merged = common.merge_metric_queries(None, defaults)
+    merged.append("mutated")
+    assert common.merge_metric_queries(None, defaults) == ["a", "b"]
+    assert common.merge_metric_queries(None, ["a", "z"]) == ["a", "z"]
+
+
+def test_orjson_response_encodes_dataclasses_and_numpy():
+    from engine.causal.granger import GrangerResult
+    import numpy as np
+
+    pair = GrangerResult("a", "b", 2, np.float64(3.5), 0.01, True, 0.5)
+    response = common.OrjsonResponse({"pairs": [pair], "values": np.array([1, 2]), "n": np.int64(3)})
+
+    assert response.media_type == "application/json"
+    assert response.body == (
+        b'{"pairs":[{"cause_metric":"a","effect_metric":"b","max_lag":2,"f_statistic":3.5,'
+        b'"p_value":0.01,"is_causal":true,"strength":0.5}],"values":[1,2],"n":3}'
+    )
+
+
+@pytest.mark.asyncio
+async def test_upstream_errors_translates_failures():
+    async def bad() -> str:
+        raise ConnectionError("backend down")
+
+    with pytest.raises(HTTPException) as exc:
+        with common.upstream_errors(500):
+            await bad()
+    assert exc.value.status_code == 500
+    assert exc.value.detail == "backend down"
+
+    with common.upstream_errors():
+        value = 3
+    assert value == 3
@@ -8,54 +8,86 @@ You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2
 
 from __future__ import annotations
 
-import pytest
-from fastapi import HTTPException
+import logging
 
-from api.routes.exception import handle_exceptions
+from fastapi import FastAPI, HTTPException
+from fastapi.testclient import TestClient
 
+from api.routes.exception import unhandled_exception_handler
 
-@pytest.mark.asyncio
-async def test_handle_exceptions_wraps_async_success_and_errors():
-    @handle_exceptions
-    async def ok() -> str:
-        return "ok"
 
-    @handle_exceptions
-    async def http_fail() -> str:
+def _app() -> FastAPI:
+    app = FastAPI()
+    app.add_exception_handler(Exception, unhandled_exception_handler)
+
+    @app.get("/ok")
+    async def ok() -> dict[str, str]:
+        return {"status": "ok"}
+
+    @app.get("/http-fail")
+    async def http_fail() -> dict[str, str]:
         raise HTTPException(status_code=409, detail="conflict")
 
-    @handle_exceptions
-    async def fail() -> str:
+    @app.get("/fail")
+    async def fail() -> dict[str, str]:
         raise RuntimeError("async boom")
 
-    assert await ok() == "ok"
-    with pytest.raises(HTTPException) as http_exc:
-        await http_fail()
-    assert http_exc.value.status_code == 409
-    with pytest.raises(HTTPException) as exc:
-        await fail()
-    assert exc.value.status_code == 500
-    assert exc.value.detail == "async boom"
+    @app.get("/sync-fail")
+    def sync_fail() -> dict[str, str]:
+        raise ValueError("sync boom")
 
+    return app
 
-def test_handle_exceptions_wraps_sync_success_and_errors():
-    @handle_exceptions
-    def ok() -> str:
-        return "ok"
 
-    @handle_exceptions
-    def http_fail() -> str:
-        raise HTTPException(status_code=404, detail="missing")
+def test_unhandled_exception_handler_maps_errors_to_500():
+    client = TestClient(_app(), raise_server_exceptions=False)
 
-    @handle_exceptions
-    def fail() -> str:
-        raise ValueError("sync boom")
+    assert client.get("/ok").json() == {"status": "ok"}
+    conflict = client.get("/http-fail")
+    assert conflict.status_code == 409
+    assert conflict.json() == {"detail": "conflict"}
+    failed = client.get("/fail")
+    assert failed.status_code == 500
+    assert failed.json() == {"detail": "Internal Server Error"}
+    sync_failed = client.get("/sync-fail")
+    assert sync_failed.status_code == 500
+    assert sync_failed.json() == {"detail": "Internal Server Error"}
+
+
+def test_unhandled_exception_handler_logs_without_leaking_message(caplog):
+    client = TestClient(_app(), raise_server_exceptions=False)
+
+    with caplog.at_level(logging.ERROR, logger="api.routes.exception"):
+        failed = client.get("/fail")
+
+    assert "async boom" not in failed.text
+    assert any(record.exc_info and "async boom" in str(record.exc_info[1]) for record in caplog.records)
+
+
+def test_main_app_jobs_route_does_not_leak_unhandled_errors(monkeypatch, caplog):
+    import main
+    from api.routes import jobs as jobs_route
+    from services import security_service
+
+    async def broken_list_jobs(**_kwargs):
+        raise RuntimeError("password authentication failed for user becertain")
+
+    monkeypatch.setattr(jobs_route, "_require_permission", lambda name: None)
+    monkeypatch.setattr(jobs_route, "_required_context", lambda: object())
+    monkeypatch.setattr(jobs_route.rca_job_service, "list_jobs", broken_list_jobs)
+    monkeypatch.setattr(security_service, "_requires_internal_auth", lambda path: False)
+
+    client = TestClient(main.app, raise_server_exceptions=False)
+    with caplog.at_level(logging.ERROR, logger="api.routes.exception"):
+        response = client.get("/api/v1/jobs")
+
+    assert response.status_code == 500
+    assert response.json() == {"detail": "Internal Server Error"}
+    assert "password" not in response.text
+    assert any("/api/v1/jobs" in record.getMessage() for record in caplog.records)
+
+
+def test_main_app_registers_unhandled_exception_handler():
+    import main
 
-    assert ok() == "ok"
-    with pytest.raises(HTTPException) as http_exc:
-        http_fail()
-    assert http_exc.value.status_code == 404
-    with pytest.raises(HTTPException) as exc:
-        fail()
-    assert exc.value.status_code == 500
-    assert exc.value.detail == "sync boom"
\ No newline at end of file
+    assert main.app.exception_handlers[Exception] is unhandled_exception_handler
@@ -32,8 +32,8 @@ def _context(permissions: list[str]) -> InternalContext:
         org_id="tenant-ctx",
         user_id="u1",
         username="alice",
-        permissions=permissions,
-        group_ids=[],
+        permissions=frozenset(permissions),
+        group_ids=(),
         role="user",
         is_superuser=False,
     )
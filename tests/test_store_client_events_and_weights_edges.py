@@ -27,8 +27,8 @@ class _FakePipeline:
         self.calls: list[tuple] = []
         self.error = error
 
-    def rpush(self, key: str, value: str) -> object:
-        self.calls.append(("rpush", key, value))
+    def rpush(self, key: str, *values: str) -> object:
+        self.calls.append(("rpush", key, *values))
         return None
 
     def ltrim(self, key: str, start: int, end: int) -> object:
@@ -183,6 +183,8 @@ async def test_store_client_ops_success_and_error_fallback(monkeypatch):
     await client_mod.redis_rpush("events", "new-item", max_len=2)
     assert client_mod._fallback_lists["events"] == ["old", "new-item"]
     assert await client_mod.redis_lrange("events") == ["old", "new-item"]
+    await client_mod.redis_rpush_many("events", ["x", "y"], max_len=3)
+    assert client_mod._fallback_lists["events"] == ["new-item", "x", "y"]
     assert sorted(await client_mod.redis_scan("*")) == ["cached", "new"]
     await client_mod.redis_delete("cached")
     assert "cached" not in client_mod._fallback
@@ -52,3 +52,24 @@ def test_from_spans():
     ]
     g.from_spans(spans)
     assert "b" in g._forward["a"]
+
+
+def test_from_spans_stops_scanning_spans_once_edge_is_resolved():
+    class ExplodingSpan(dict):
+        def get(self, key, default=None):
+            raise AssertionError("span scanned after service and peer were resolved")
+
+    g = DependencyGraph()
+    g.from_spans([
+        {
+            "rootServiceName": "a",
+            "spanSet": {
+                "attributes": [{"key": "service.name", "value": {"stringValue": "a"}}],
+                "spans": [
+                    {"attributes": [{"key": "peer.service", "value": {"stringValue": "b"}}]},
+                    ExplodingSpan(),
+                ],
+            },
+        }
+    ])
+    assert g._forward["a"] == {"b"}